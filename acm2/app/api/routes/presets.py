@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional
 from dataclasses import asdict
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Dict, Any
 
@@ -503,6 +503,43 @@ def _derive_iterations(preset) -> int:
     return iterations
 
 
+# Complete config section models by section key (the config_overrides key)
+_CONFIG_COMPLETE_MODELS = {
+    "general": GeneralConfigComplete,
+    "fpf": FpfConfigComplete,
+    "gptr": GptrConfigComplete,
+    "dr": DrConfigComplete,
+    "ma": MaConfigComplete,
+    "eval": EvalConfigComplete,
+    "pairwise": PairwiseConfigComplete,
+    "combine": CombineConfigComplete,
+    "concurrency": ConcurrencyConfigComplete,
+}
+
+# Parsed config sections per preset id, with the updated_at they were parsed at. The
+# *ConfigComplete models are frozen, so cached instances are shared between responses.
+_PRESET_CONFIG_CACHE_MAX = 256
+_preset_config_cache: dict[str, tuple[Any, dict]] = {}
+
+
+def _preset_configs(preset, overrides: dict) -> dict:
+    """Build the complete config objects from a preset's overrides (None if absent)."""
+    cached = _preset_config_cache.get(preset.id)
+    if preset.updated_at is not None and cached and cached[0] == preset.updated_at:
+        return cached[1]
+
+    configs = {
+        key: model(**overrides[key]) if key in overrides else None
+        for key, model in _CONFIG_COMPLETE_MODELS.items()
+    }
+    # Never-updated rows have no version to validate against, so they are not cached
+    if preset.updated_at is not None:
+        if preset.id not in _preset_config_cache and len(_preset_config_cache) >= _PRESET_CONFIG_CACHE_MAX:
+            del _preset_config_cache[next(iter(_preset_config_cache))]
+        _preset_config_cache[preset.id] = (preset.updated_at, configs)
+    return configs
+
+
 def _preset_to_response(preset) -> PresetResponse:
     """Convert DB preset to API response."""
     runs = _get_runs_safely(preset)
@@ -513,43 +550,8 @@ def _preset_to_response(preset) -> PresetResponse:
     if "combine" in overrides:
         combine_settings = CombineSettings(**overrides["combine"])
     
-    # Build complete config objects from overrides
-    general_config = None
-    if "general" in overrides:
-        general_config = GeneralConfigComplete(**overrides["general"])
-    
-    fpf_config = None
-    if "fpf" in overrides:
-        fpf_config = FpfConfigComplete(**overrides["fpf"])
-    
-    gptr_config = None
-    if "gptr" in overrides:
-        gptr_config = GptrConfigComplete(**overrides["gptr"])
-    
-    dr_config = None
-    if "dr" in overrides:
-        dr_config = DrConfigComplete(**overrides["dr"])
-    
-    ma_config = None
-    if "ma" in overrides:
-        ma_config = MaConfigComplete(**overrides["ma"])
-    
-    eval_config = None
-    if "eval" in overrides:
-        eval_config = EvalConfigComplete(**overrides["eval"])
-    
-    pairwise_config = None
-    if "pairwise" in overrides:
-        pairwise_config = PairwiseConfigComplete(**overrides["pairwise"])
-    
-    combine_config = None
-    if "combine" in overrides:
-        combine_config = CombineConfigComplete(**overrides["combine"])
-    
-    concurrency_config = None
-    if "concurrency" in overrides:
-        concurrency_config = ConcurrencyConfigComplete(**overrides["concurrency"])
-        
+    configs = _preset_configs(preset, overrides)
+
     return PresetResponse(
         id=preset.id,
         name=preset.name,
@@ -562,15 +564,15 @@ def _preset_to_response(preset) -> PresetResponse:
         combine_instructions_id=preset.combine_instructions_id,
         generation_instructions_id=preset.generation_instructions_id,
         # Complete config objects (NEW)
-        general_config=general_config,
-        fpf_config=fpf_config,
-        gptr_config=gptr_config,
-        dr_config=dr_config,
-        ma_config=ma_config,
-        eval_config=eval_config,
-        pairwise_config=pairwise_config,
-        combine_config=combine_config,
-        concurrency_config=concurrency_config,
+        general_config=configs["general"],
+        fpf_config=configs["fpf"],
+        gptr_config=configs["gptr"],
+        dr_config=configs["dr"],
+        ma_config=configs["ma"],
+        eval_config=configs["eval"],
+        pairwise_config=configs["pairwise"],
+        combine_config=configs["combine"],
+        concurrency_config=configs["concurrency"],
         # Logging - REQUIRED
         log_level=preset.log_level,
         # GitHub input source configuration - REQUIRED
@@ -741,7 +743,7 @@ async def list_presets(
     page_size: int = Query(20, ge=1, le=100),
     user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_user_db)
-) -> PresetList:
+) -> Any:
     """
     List all presets with pagination.
     """
@@ -753,13 +755,16 @@ async def list_presets(
     total = await repo.count()
     pages = (total + page_size - 1) // page_size
     
-    return PresetList(
+    preset_list = PresetList(
         items=[_preset_to_summary(p) for p in presets],
         total=total,
         page=page,
         page_size=page_size,
         pages=pages,
     )
+    # Already a validated PresetList: send its JSON directly rather than letting FastAPI
+    # dump, re-validate and re-serialize it against response_model
+    return Response(content=preset_list.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{preset_id}", response_model=PresetResponse)
@@ -767,7 +772,7 @@ async def get_preset(
     preset_id: str,
     user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_user_db)
-) -> PresetResponse:
+) -> Any:
     """
     Get a specific preset by ID.
     """
@@ -777,7 +782,8 @@ async def get_preset(
     if not preset:
         raise HTTPException(status_code=404, detail="Preset not found")
     
-    return _preset_to_response(preset)
+    # Same as list_presets: skip FastAPI's second validation pass over the wide response
+    return Response(content=_preset_to_response(preset).model_dump_json(), media_type="application/json")
 
 
 @router.put("/{preset_id}", response_model=PresetResponse)
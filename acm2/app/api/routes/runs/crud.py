@@ -6,7 +6,7 @@ Endpoints for creating, listing, getting, and deleting runs.
 import logging
 from typing import Any, Optional, List
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any, Optional, Dict
 
@@ -211,7 +211,7 @@ async def list_runs(
     page_size: int = Query(20, ge=1, le=100),
     user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_user_db)
-) -> RunList:
+) -> Response:
     """
     List all runs with pagination.
     """
@@ -224,13 +224,17 @@ async def list_runs(
     items = [to_summary(r) for r in runs]
     pages = (total + page_size - 1) // page_size
     
-    return RunList(
+    # The items are already validated RunSummary models, so the envelope is built
+    # without re-validating them and sent as JSON directly rather than letting FastAPI
+    # dump, re-validate and re-serialize it against response_model
+    run_list = RunList.model_construct(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
         pages=pages,
     )
+    return Response(content=run_list.model_dump_json(), media_type="application/json")
 
 
 @router.get("/runs/{run_id}", response_model=RunDetail)
@@ -238,7 +242,7 @@ async def get_run(
     run_id: str,
     user: Dict[str, Any] = Depends(get_current_user),
     db: AsyncSession = Depends(get_user_db)
-) -> Any:
+) -> Response:
     """
     Get detailed information about a specific run.
     """
@@ -248,7 +252,8 @@ async def get_run(
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
     try:
-        return to_detail(run)
+        # Same as list_runs: skip FastAPI's second validation pass over the RunDetail tree
+        return Response(content=to_detail(run).model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.exception(f"Error serializing run {run_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving run: {str(e)}")
@@ -4,12 +4,19 @@ Run lifecycle execution control.
 Endpoints for starting, pausing, resuming, and cancelling runs.
 """
 import asyncio
+import bisect
+import hashlib
+import json
 import logging
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Dict, Optional
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 
@@ -28,8 +35,65 @@ from .helpers import serialize_dataclass
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Track active executors for cancellation support
-_active_executors: Dict[str, RunExecutor] = {}
+
+def _iso_opt(dt: Optional[datetime]) -> Optional[str]:
+    """ISO-format an optional datetime (None stays None)."""
+    return dt.isoformat() if dt else None
+
+
+def _enum_value(value: Any) -> str:
+    """Return an enum member's value, or str() of anything else."""
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+def _score_dicts(eval_result: SingleEvalResult, cache: dict[int, tuple]) -> list[dict]:
+    """Convert an eval result's criterion scores to dicts, once per result per run.
+
+    The same SingleEvalResult is seen by on_eval_complete and again by the completion
+    builder. cache maps id(result) -> (result, dicts); it holds the result so the id
+    cannot be reused while the entry exists.
+    """
+    entry = cache.get(id(eval_result))
+    if entry is None:
+        dicts = [{"criterion": s.criterion, "score": s.score, "reason": s.reason} for s in eval_result.scores]
+        entry = (eval_result, dicts)
+        cache[id(eval_result)] = entry
+    return entry[1]
+
+
+# Track active executors for cancellation support. Only execute_run_background holds a
+# strong reference, so an entry disappears once its run task finishes even if cleanup
+# never ran.
+_active_executors: "weakref.WeakValueDictionary[str, RunExecutor]" = weakref.WeakValueDictionary()
+
+
+async def _persist_failure(user_uuid: str, run_id: str, error_message: str) -> None:
+    """Mark a run as failed after an unexpected error.
+
+    Uses its own session because the run's shared write session may be unusable
+    after the error. Never raises: a failure to record the failure is only logged.
+    """
+    try:
+        async with get_user_session_by_uuid(user_uuid) as session:
+            run_repo = RunRepository(session, user_uuid=user_uuid)
+            await run_repo.fail(run_id, error_message=error_message)
+    except Exception:
+        logger.exception(f"Failed to persist failure status for run {run_id}")
+
+
+def _cleanup_run(run_id: str, run_logger: Optional[logging.Logger]) -> None:
+    """Unregister a run's executor and close its log handlers. Safe to call more than once."""
+    popped = _active_executors.pop(run_id, None)
+    logger.debug(f"Executor cleanup for run {run_id}; popped={bool(popped)}")
+    if not run_logger:
+        return
+    for handler in list(run_logger.handlers):
+        run_logger.removeHandler(handler)
+        try:
+            handler.flush()
+            handler.close()
+        except Exception:
+            logger.exception("Failed to close run logger handler")
 
 
 async def execute_run_background(run_id: str, config: RunConfig):
@@ -53,177 +117,176 @@ async def execute_run_background(run_id: str, config: RunConfig):
         prev_executor = _active_executors.get(run_id)
         _active_executors[run_id] = executor
         logger.debug(f"Registered executor for run {run_id}; previous_executor_exists={bool(prev_executor)}")
+
+        # One session serves every DB write made on behalf of this run (callbacks and
+        # the final completion write). The executor also writes to this run row from
+        # its own sessions, so cached state is expired before each read-modify-write.
+        async with get_user_session_by_uuid(config.user_uuid) as write_session:
+            run_repo = RunRepository(write_session, user_uuid=config.user_uuid)
+
+            # Set up incremental DB save callback for evaluations
+            # Shared state for accumulating results (protected by lock)
+            db_lock = asyncio.Lock()
+            pre_combine_evals_detailed_incremental = {}
+            pre_combine_evals_incremental: dict[str, dict[str, float]] = {}
+            generated_docs_incremental = []  # Track generated docs for incremental save
+            score_dicts_cache: dict[int, tuple] = {}  # Shared by the eval callback and the completion builder
+            gen_doc_to_source_doc: dict[str, str] = {}
+            # Track evaluator and criterion sets so the UI can render per-judge, per-criterion badges while the run is live
+            # (sets for membership, plus lists kept sorted on insert so no per-event sort is needed)
+            all_evaluators_incremental: set[str] = set()
+            all_criteria_incremental: set[str] = set()
+            evaluators_sorted_incremental: list[str] = []
+            criteria_sorted_incremental: list[str] = []
+            eval_count = 0
+            gen_count = 0
         
-        # Set up incremental DB save callback for evaluations
-        # Shared state for accumulating results (protected by lock)
-        db_lock = asyncio.Lock()
-        pre_combine_evals_detailed_incremental = {}
-        generated_docs_incremental = []  # Track generated docs for incremental save
-        gen_doc_to_source_doc: dict[str, str] = {}
-        # Track evaluator and criterion sets so the UI can render per-judge, per-criterion badges while the run is live
-        all_evaluators_incremental: set[str] = set()
-        all_criteria_incremental: set[str] = set()
-        eval_count = 0
-        gen_count = 0
-        
-        async def on_gen_complete(doc_id: str, model: str, generator: str, source_doc_id: str, iteration: int):
-            """Callback fired after each document generation - writes generated_docs to DB immediately."""
-            nonlocal gen_count
+            async def on_gen_complete(doc_id: str, model: str, generator: str, source_doc_id: str, iteration: int):
+                """Callback fired after each document generation - writes generated_docs to DB immediately."""
+                nonlocal gen_count
             
-            logger.info(f"[on_gen_complete] CALLED: doc_id={doc_id}, model={model}, generator={generator}")
+                logger.info(f"[on_gen_complete] CALLED: doc_id={doc_id}, model={model}, generator={generator}")
             
-            async with db_lock:
-                gen_count += 1
-
-                gen_doc_to_source_doc[doc_id] = source_doc_id
-                
-                # Build the doc info
-                doc_info = {
-                    "id": doc_id,
-                    "model": model,
-                    "source_doc_id": source_doc_id,
-                    "generator": generator,
-                    "iteration": iteration,
-                }
-                generated_docs_incremental.append(doc_info)
-                logger.info(f"[on_gen_complete] generated_docs_incremental now has {len(generated_docs_incremental)} items")
+                async with db_lock:
+                    gen_count += 1
+
+                    gen_doc_to_source_doc[doc_id] = source_doc_id
                 
-                # Write to DB using append method (safe against race conditions)
-                async with get_user_session_by_uuid(config.user_uuid) as session:
-                    repo = RunRepository(session, user_uuid=config.user_uuid)
-                    result = await repo.append_generated_doc(run_id, doc_info)
+                    # Build the doc info
+                    doc_info = {
+                        "id": doc_id,
+                        "model": model,
+                        "source_doc_id": source_doc_id,
+                        "generator": generator,
+                        "iteration": iteration,
+                    }
+                    generated_docs_incremental.append(doc_info)
+                    logger.info(f"[on_gen_complete] generated_docs_incremental now has {len(generated_docs_incremental)} items")
+                
+                    # Write to DB using append method (safe against race conditions)
+                    write_session.expire_all()
+                    result = await run_repo.append_generated_doc(run_id, doc_info)
                     if result:
                         logger.info(f"[on_gen_complete] Appended to DB: generated_docs count now {len(result.results_summary.get('generated_docs', []))}")
                     else:
                         logger.warning(f"[on_gen_complete] Run {run_id} not found in DB!")
 
-                # Also write per-source-doc generated_docs so per-doc tabs populate
-                async with get_user_session_by_uuid(config.user_uuid) as session:
-                    repo = RunRepository(session, user_uuid=config.user_uuid)
-                    await repo.append_source_doc_generated_doc(run_id, source_doc_id, doc_info)
-                
-                logger.info(f"[DB] Saved gen #{gen_count}: {doc_id} | {model}")
+                    # Also write per-source-doc generated_docs so per-doc tabs populate
+                    await run_repo.append_source_doc_generated_doc(run_id, source_doc_id, doc_info)
+
+                    logger.info(f"[DB] Saved gen #{gen_count}: {doc_id} | {model}")
         
-        async def on_eval_complete(doc_id: str, judge_model: str, trial: int, result: SingleEvalResult):
-            """Callback fired after each individual judge evaluation - writes to DB immediately."""
-            nonlocal eval_count
+            async def on_eval_complete(doc_id: str, judge_model: str, trial: int, result: SingleEvalResult):
+                """Callback fired after each individual judge evaluation - writes to DB immediately."""
+                nonlocal eval_count
             
-            async with db_lock:
-                eval_count += 1
+                async with db_lock:
+                    eval_count += 1
 
-                source_doc_id = gen_doc_to_source_doc.get(doc_id)
+                    source_doc_id = gen_doc_to_source_doc.get(doc_id)
                 
-                # Initialize doc entry if needed
-                if doc_id not in pre_combine_evals_detailed_incremental:
-                    pre_combine_evals_detailed_incremental[doc_id] = {
-                        "evaluations": [],
-                        "overall_average": 0.0,
-                    }
+                    # Initialize doc entry if needed
+                    if doc_id not in pre_combine_evals_detailed_incremental:
+                        pre_combine_evals_detailed_incremental[doc_id] = {
+                            "evaluations": [],
+                            "overall_average": 0.0,
+                        }
                 
-                # Add this evaluation
-                eval_entry = {
-                    "judge_model": result.model,
-                    "trial": trial,
-                    "scores": [{"criterion": s.criterion, "score": s.score, "reason": s.reason} for s in result.scores],
-                    "average_score": result.average_score,
-                }
-                pre_combine_evals_detailed_incremental[doc_id]["evaluations"].append(eval_entry)
-                # Track evaluators and criteria for incremental UI rendering
-                all_evaluators_incremental.add(result.model)
-                for s in result.scores:
-                    all_criteria_incremental.add(s.criterion)
+                    # Add this evaluation
+                    eval_entry = {
+                        "judge_model": result.model,
+                        "trial": trial,
+                        "scores": _score_dicts(result, score_dicts_cache),
+                        "average_score": result.average_score,
+                    }
+                    pre_combine_evals_detailed_incremental[doc_id]["evaluations"].append(eval_entry)
+                    # Track evaluators and criteria for incremental UI rendering
+                    if result.model not in all_evaluators_incremental:
+                        all_evaluators_incremental.add(result.model)
+                        bisect.insort(evaluators_sorted_incremental, result.model)
+                    for s in result.scores:
+                        if s.criterion not in all_criteria_incremental:
+                            all_criteria_incremental.add(s.criterion)
+                            bisect.insort(criteria_sorted_incremental, s.criterion)
                 
-                # Recalculate overall average for this doc
-                all_avgs = [e["average_score"] for e in pre_combine_evals_detailed_incremental[doc_id]["evaluations"]]
-                pre_combine_evals_detailed_incremental[doc_id]["overall_average"] = sum(all_avgs) / len(all_avgs) if all_avgs else 0.0
+                    # Recalculate overall average for this doc
+                    all_avgs = [e["average_score"] for e in pre_combine_evals_detailed_incremental[doc_id]["evaluations"]]
+                    pre_combine_evals_detailed_incremental[doc_id]["overall_average"] = sum(all_avgs) / len(all_avgs) if all_avgs else 0.0
                 
-                # Build pre_combine_evals (criterion -> score mapping)
-                pre_combine_evals = {}
-                for d_id, details in pre_combine_evals_detailed_incremental.items():
-                    criterion_scores = {}
-                    for ev in details["evaluations"]:
+                    # Update pre_combine_evals (criterion -> score mapping) for this doc only;
+                    # entries for other docs cannot have changed since their last event
+                    criterion_scores: dict[str, list] = {}
+                    for ev in pre_combine_evals_detailed_incremental[doc_id]["evaluations"]:
                         for sc in ev["scores"]:
-                            crit = sc["criterion"]
-                            if crit not in criterion_scores:
-                                criterion_scores[crit] = []
-                            criterion_scores[crit].append(sc["score"])
-                    pre_combine_evals[d_id] = {c: sum(s)/len(s) for c, s in criterion_scores.items()}
-                
-                # Write to DB
-                async with get_user_session_by_uuid(config.user_uuid) as session:
-                    repo = RunRepository(session, user_uuid=config.user_uuid)
-                    run_fresh = await repo.get_by_id(run_id)
+                            criterion_scores.setdefault(sc["criterion"], []).append(sc["score"])
+                    pre_combine_evals_incremental[doc_id] = {c: sum(s)/len(s) for c, s in criterion_scores.items()}
+                
+                    # Write to DB
+                    write_session.expire_all()
+                    run_fresh = await run_repo.get_by_id(run_id)
                     if run_fresh:
                         results_summary_updated = dict(run_fresh.results_summary or {})
-                        results_summary_updated["pre_combine_evals"] = pre_combine_evals
+                        results_summary_updated["pre_combine_evals"] = pre_combine_evals_incremental
                         results_summary_updated["pre_combine_evals_detailed"] = pre_combine_evals_detailed_incremental
                         # Persist evaluator/criteria lists incrementally so the frontend can render per-judge, per-criterion badges before completion
-                        results_summary_updated["evaluator_list"] = sorted(list(all_evaluators_incremental))
-                        results_summary_updated["criteria_list"] = sorted(list(all_criteria_incremental))
-                        await repo.update(run_id, results_summary=results_summary_updated)
-
-                # Also write per-source-doc single_eval_results so per-doc evaluation tab fills
-                if source_doc_id:
-                    overall_avg = float(pre_combine_evals_detailed_incremental[doc_id]["overall_average"])
-                    async with get_user_session_by_uuid(config.user_uuid) as session:
-                        repo = RunRepository(session, user_uuid=config.user_uuid)
-                        await repo.upsert_source_doc_single_eval_result(
+                        results_summary_updated["evaluator_list"] = list(evaluators_sorted_incremental)
+                        results_summary_updated["criteria_list"] = list(criteria_sorted_incremental)
+                        await run_repo.update(run_id, results_summary=results_summary_updated)
+
+                    # Also write per-source-doc single_eval_results so per-doc evaluation tab fills
+                    if source_doc_id:
+                        overall_avg = float(pre_combine_evals_detailed_incremental[doc_id]["overall_average"])
+                        await run_repo.upsert_source_doc_single_eval_result(
                             run_id,
                             source_doc_id,
                             doc_id,
                             {"avg_score": overall_avg},
                         )
                 
-                logger.info(f"[DB] Saved eval #{eval_count}: {doc_id} | {judge_model} trial={trial} avg={result.average_score:.2f}")
+                    logger.info(f"[DB] Saved eval #{eval_count}: {doc_id} | {judge_model} trial={trial} avg={result.average_score:.2f}")
         
-        # Attach callbacks to config
-        config.on_gen_complete = on_gen_complete
-        config.on_eval_complete = on_eval_complete
+            # Attach callbacks to config
+            config.on_gen_complete = on_gen_complete
+            config.on_eval_complete = on_eval_complete
         
-        result = await executor.execute(run_id, config)
+            result = await executor.execute(run_id, config)
         
-        # Update run in DB
-        async with get_user_session_by_uuid(config.user_uuid) as session:
-            run_repo = RunRepository(session, user_uuid=config.user_uuid)
+            # Update run in DB
+            write_session.expire_all()
             
             if result.status.value == "completed":
                 # Build generated docs list for frontend display
-                generated_docs_info = []
-                generation_events = []
+                generated_docs_info = [{
+                    "id": gen_doc.doc_id,
+                    "model": gen_doc.model,
+                    "source_doc_id": gen_doc.source_doc_id,
+                    "generator": _enum_value(gen_doc.generator),
+                    "iteration": gen_doc.iteration,
+                    "cost_usd": gen_doc.cost_usd or 0.0,
+                } for gen_doc in result.generated_docs]
                 
-                for gen_doc in result.generated_docs:
-                    generated_docs_info.append({
-                        "id": gen_doc.doc_id,
-                        "model": gen_doc.model,
-                        "source_doc_id": gen_doc.source_doc_id,
-                        "generator": gen_doc.generator.value if hasattr(gen_doc.generator, 'value') else str(gen_doc.generator),
-                        "iteration": gen_doc.iteration,
-                        "cost_usd": gen_doc.cost_usd or 0.0,
-                    })
-                    
-                    generation_events.append({
-                        "doc_id": gen_doc.doc_id,
-                        "generator": gen_doc.generator.value if hasattr(gen_doc.generator, 'value') else str(gen_doc.generator),
-                        "model": gen_doc.model,
-                        "source_doc_id": gen_doc.source_doc_id,
-                        "iteration": gen_doc.iteration,
-                        "duration_seconds": gen_doc.duration_seconds,
-                        "cost_usd": gen_doc.cost_usd,
-                        "status": "completed",
-                        "started_at": gen_doc.started_at.isoformat() if hasattr(gen_doc, 'started_at') and gen_doc.started_at else None,
-                        "completed_at": gen_doc.completed_at.isoformat() if hasattr(gen_doc, 'completed_at') and gen_doc.completed_at else None,
-                    })
+                generation_events = [{
+                    "doc_id": gen_doc.doc_id,
+                    "generator": _enum_value(gen_doc.generator),
+                    "model": gen_doc.model,
+                    "source_doc_id": gen_doc.source_doc_id,
+                    "iteration": gen_doc.iteration,
+                    "duration_seconds": gen_doc.duration_seconds,
+                    "cost_usd": gen_doc.cost_usd,
+                    "status": "completed",
+                    "started_at": _iso_opt(gen_doc.started_at),
+                    "completed_at": _iso_opt(gen_doc.completed_at),
+                } for gen_doc in result.generated_docs]
                 
                 # Add combined docs to generated_docs_info
-                for combined_doc in (result.combined_docs or []):
-                    generated_docs_info.append({
-                        "id": combined_doc.doc_id,
-                        "model": combined_doc.model,
-                        "source_doc_id": combined_doc.source_doc_id,
-                        "generator": "combine",
-                        "iteration": 1,
-                        "cost_usd": combined_doc.cost_usd or 0.0,
-                    })
+                generated_docs_info.extend({
+                    "id": combined_doc.doc_id,
+                    "model": combined_doc.model,
+                    "source_doc_id": combined_doc.source_doc_id,
+                    "generator": "combine",
+                    "iteration": 1,
+                    "cost_usd": combined_doc.cost_usd or 0.0,
+                } for combined_doc in (result.combined_docs or []))
                 
                 # Build per-document cost tracking
                 doc_generation_costs = {}
@@ -242,7 +305,7 @@ async def execute_run_background(run_id: str, config: RunConfig):
                 if result.single_eval_results:
                     # Get deviations from any summary (they're all the same)
                     for summary in result.single_eval_results.values():
-                        if hasattr(summary, 'deviations_by_judge_criterion') and summary.deviations_by_judge_criterion:
+                        if summary.deviations_by_judge_criterion:
                             eval_deviations = summary.deviations_by_judge_criterion
                             break
                 
@@ -282,23 +345,17 @@ async def execute_run_background(run_id: str, config: RunConfig):
                                 judge_scores[judge_model] = []
                             judge_scores[judge_model].append(eval_result.average_score)
                             
-                            criteria_scores = []
-                            for cs in eval_result.scores:
-                                all_criteria.add(cs.criterion)
-                                criteria_scores.append({
-                                    "criterion": cs.criterion,
-                                    "score": cs.score,
-                                    "reason": cs.reason,
-                                })
+                            criteria_scores = _score_dicts(eval_result, score_dicts_cache)
+                            all_criteria.update(cs["criterion"] for cs in criteria_scores)
                             
                             evaluations.append({
                                 "judge_model": judge_model,
                                 "trial": eval_result.trial,
                                 "scores": criteria_scores,
                                 "average_score": eval_result.average_score,
-                                "started_at": eval_result.started_at.isoformat() if hasattr(eval_result, 'started_at') and eval_result.started_at else None,
-                                "completed_at": eval_result.completed_at.isoformat() if hasattr(eval_result, 'completed_at') and eval_result.completed_at else None,
-                                "duration_seconds": eval_result.duration_seconds if hasattr(eval_result, 'duration_seconds') else None,
+                                "started_at": _iso_opt(eval_result.started_at),
+                                "completed_at": _iso_opt(eval_result.completed_at),
+                                "duration_seconds": eval_result.duration_seconds,
                             })
                         
                         pre_combine_evals_detailed[gen_doc_id] = {
@@ -329,23 +386,17 @@ async def execute_run_background(run_id: str, config: RunConfig):
                                     judge_scores[judge_model] = []
                                 judge_scores[judge_model].append(eval_result.average_score)
                                 
-                                criteria_scores = []
-                                for cs in eval_result.scores:
-                                    all_criteria.add(cs.criterion)
-                                    criteria_scores.append({
-                                        "criterion": cs.criterion,
-                                        "score": cs.score,
-                                        "reason": cs.reason,
-                                    })
+                                criteria_scores = _score_dicts(eval_result, score_dicts_cache)
+                                all_criteria.update(cs["criterion"] for cs in criteria_scores)
                                 
                                 evaluations.append({
                                     "judge_model": judge_model,
                                     "trial": eval_result.trial,
                                     "scores": criteria_scores,
                                     "average_score": eval_result.average_score,
-                                    "started_at": eval_result.started_at.isoformat() if hasattr(eval_result, 'started_at') and eval_result.started_at else None,
-                                    "completed_at": eval_result.completed_at.isoformat() if hasattr(eval_result, 'completed_at') and eval_result.completed_at else None,
-                                    "duration_seconds": eval_result.duration_seconds if hasattr(eval_result, 'duration_seconds') else None,
+                                    "started_at": _iso_opt(eval_result.started_at),
+                                    "completed_at": _iso_opt(eval_result.completed_at),
+                                    "duration_seconds": eval_result.duration_seconds,
                                 })
                             
                             post_combine_evals_detailed[combined_id] = {
@@ -359,26 +410,22 @@ async def execute_run_background(run_id: str, config: RunConfig):
                 
                 # Build pairwise results
                 pairwise_data = None
-                comparisons = []
                 if result.pairwise_results:
-                    for pr in (result.pairwise_results.results or []):
-                        comparisons.append({
-                            "doc_id_a": pr.doc_id_1,
-                            "doc_id_b": pr.doc_id_2,
-                            "winner": pr.winner_doc_id,
-                            "judge_model": pr.model,
-                            "trial": pr.trial,
-                            "reason": pr.reason,
-                        })
-                    
                     pairwise_data = {
                         "total_comparisons": result.pairwise_results.total_comparisons,
                         "winner_doc_id": result.pairwise_results.winner_doc_id,
                         "rankings": [
                             {"doc_id": r.doc_id, "wins": r.wins, "losses": r.losses, "elo": r.rating}
                             for r in (result.pairwise_results.elo_ratings or [])
-                        ] if result.pairwise_results.elo_ratings else [],
-                        "comparisons": comparisons,
+                        ],
+                        "comparisons": [{
+                            "doc_id_a": pr.doc_id_1,
+                            "doc_id_b": pr.doc_id_2,
+                            "winner": pr.winner_doc_id,
+                            "judge_model": pr.model,
+                            "trial": pr.trial,
+                            "reason": pr.reason,
+                        } for pr in (result.pairwise_results.results or [])],
                         "pairwise_deviations": result.pairwise_results.deviations_by_judge or {},
                     }
                 
@@ -394,101 +441,91 @@ async def execute_run_background(run_id: str, config: RunConfig):
                                 eval_scores[source_doc_id] = {}
                             eval_scores[source_doc_id][model] = summary.avg_score
                 
-                # Build timeline events
-                timeline_events = []
-                
-                if result.started_at:
-                    timeline_events.append({
-                        "phase": "initialization",
-                        "event_type": "start",
-                        "description": "Run started",
-                        "model": None,
-                        "timestamp": result.started_at.isoformat() if result.started_at else None,
-                        "duration_seconds": None,
-                        "success": True,
-                        "details": None,
-                    })
-                
-                for gen_event in generation_events:
-                    timeline_events.append({
-                        "phase": "generation",
-                        "event_type": "generation",
-                        "description": f"Generated doc using {gen_event['generator']}",
-                        "model": gen_event.get("model"),
-                        "timestamp": gen_event.get("started_at"),
-                        "completed_at": gen_event.get("completed_at"),
-                        "duration_seconds": gen_event.get("duration_seconds"),
-                        "success": gen_event.get("status") == "completed",
-                        "details": {
-                            "doc_id": gen_event.get("doc_id"),
-                            "source_doc_id": gen_event.get("source_doc_id"),
-                            "cost_usd": gen_event.get("cost_usd", 0.0),
-                        },
-                    })
+                # Build timeline events: one comprehension per phase, concatenated in order
+                init_events = [{
+                    "phase": "initialization",
+                    "event_type": "start",
+                    "description": "Run started",
+                    "model": None,
+                    "timestamp": result.started_at.isoformat(),
+                    "duration_seconds": None,
+                    "success": True,
+                    "details": None,
+                }] if result.started_at else []
                 
-                if result.single_eval_results:
-                    for doc_id, summary in result.single_eval_results.items():
-                        for eval_result in summary.results:
-                            timeline_events.append({
-                                "phase": "evaluation",
-                                "event_type": "single_eval",
-                                "description": f"Evaluated {doc_id[:20]}... with {eval_result.model}",
-                                "model": eval_result.model,
-                                "timestamp": eval_result.started_at.isoformat() if hasattr(eval_result, 'started_at') and eval_result.started_at else None,
-                                "completed_at": eval_result.completed_at.isoformat() if hasattr(eval_result, 'completed_at') and eval_result.completed_at else None,
-                                "duration_seconds": eval_result.duration_seconds if hasattr(eval_result, 'duration_seconds') else None,
-                                "success": True,
-                                "details": {
-                                    "doc_id": doc_id,
-                                    "trial": eval_result.trial,
-                                    "average_score": eval_result.average_score,
-                                },
-                            })
+                gen_events = [{
+                    "phase": "generation",
+                    "event_type": "generation",
+                    "description": f"Generated doc using {gen_event['generator']}",
+                    "model": gen_event.get("model"),
+                    "timestamp": gen_event.get("started_at"),
+                    "completed_at": gen_event.get("completed_at"),
+                    "duration_seconds": gen_event.get("duration_seconds"),
+                    "success": gen_event.get("status") == "completed",
+                    "details": {
+                        "doc_id": gen_event.get("doc_id"),
+                        "source_doc_id": gen_event.get("source_doc_id"),
+                        "cost_usd": gen_event.get("cost_usd", 0.0),
+                    },
+                } for gen_event in generation_events]
                 
-                if result.pairwise_results and result.pairwise_results.results:
-                    for pw_result in result.pairwise_results.results:
-                        timeline_events.append({
-                            "phase": "pairwise",
-                            "event_type": "pairwise_eval",
-                            "description": f"Compared {pw_result.doc_id_1[:15]}... vs {pw_result.doc_id_2[:15]}...",
-                            "model": pw_result.model,
-                            "timestamp": pw_result.started_at.isoformat() if hasattr(pw_result, 'started_at') and pw_result.started_at else None,
-                            "completed_at": pw_result.completed_at.isoformat() if hasattr(pw_result, 'completed_at') and pw_result.completed_at else None,
-                            "duration_seconds": pw_result.duration_seconds if hasattr(pw_result, 'duration_seconds') else None,
-                            "success": True,
-                            "details": {
-                                "doc_id_1": pw_result.doc_id_1,
-                                "doc_id_2": pw_result.doc_id_2,
-                                "winner": pw_result.winner_doc_id,
-                                "trial": pw_result.trial,
-                            },
-                        })
+                eval_events = [{
+                    "phase": "evaluation",
+                    "event_type": "single_eval",
+                    "description": f"Evaluated {doc_id[:20]}... with {eval_result.model}",
+                    "model": eval_result.model,
+                    "timestamp": _iso_opt(eval_result.started_at),
+                    "completed_at": _iso_opt(eval_result.completed_at),
+                    "duration_seconds": eval_result.duration_seconds,
+                    "success": True,
+                    "details": {
+                        "doc_id": doc_id,
+                        "trial": eval_result.trial,
+                        "average_score": eval_result.average_score,
+                    },
+                } for doc_id, summary in (result.single_eval_results or {}).items() for eval_result in summary.results]
                 
-                if result.combined_docs:
-                    for combined_doc in result.combined_docs:
-                        timeline_events.append({
-                            "phase": "combination",
-                            "event_type": "combine",
-                            "description": f"Combined documents using {combined_doc.model}",
-                            "model": combined_doc.model,
-                            "timestamp": combined_doc.started_at.isoformat() if hasattr(combined_doc, 'started_at') and combined_doc.started_at else None,
-                            "completed_at": combined_doc.completed_at.isoformat() if hasattr(combined_doc, 'completed_at') and combined_doc.completed_at else None,
-                            "duration_seconds": combined_doc.duration_seconds,
-                            "success": True,
-                            "details": {"combined_doc_id": combined_doc.doc_id},
-                        })
-                
-                if result.completed_at:
-                    timeline_events.append({
-                        "phase": "completion",
-                        "event_type": "complete",
-                        "description": "Run completed successfully",
-                        "model": None,
-                        "timestamp": result.completed_at.isoformat() if result.completed_at else None,
-                        "duration_seconds": result.duration_seconds,
-                        "success": True,
-                        "details": None,
-                    })
+                pw_events = [{
+                    "phase": "pairwise",
+                    "event_type": "pairwise_eval",
+                    "description": f"Compared {pw_result.doc_id_1[:15]}... vs {pw_result.doc_id_2[:15]}...",
+                    "model": pw_result.model,
+                    "timestamp": _iso_opt(pw_result.started_at),
+                    "completed_at": _iso_opt(pw_result.completed_at),
+                    "duration_seconds": pw_result.duration_seconds,
+                    "success": True,
+                    "details": {
+                        "doc_id_1": pw_result.doc_id_1,
+                        "doc_id_2": pw_result.doc_id_2,
+                        "winner": pw_result.winner_doc_id,
+                        "trial": pw_result.trial,
+                    },
+                } for pw_result in ((result.pairwise_results.results or []) if result.pairwise_results else [])]
+                
+                combine_events = [{
+                    "phase": "combination",
+                    "event_type": "combine",
+                    "description": f"Combined documents using {combined_doc.model}",
+                    "model": combined_doc.model,
+                    "timestamp": _iso_opt(combined_doc.started_at),
+                    "completed_at": _iso_opt(combined_doc.completed_at),
+                    "duration_seconds": combined_doc.duration_seconds,
+                    "success": True,
+                    "details": {"combined_doc_id": combined_doc.doc_id},
+                } for combined_doc in (result.combined_docs or [])]
+                
+                done_events = [{
+                    "phase": "completion",
+                    "event_type": "complete",
+                    "description": "Run completed successfully",
+                    "model": None,
+                    "timestamp": result.completed_at.isoformat(),
+                    "duration_seconds": result.duration_seconds,
+                    "success": True,
+                    "details": None,
+                }] if result.completed_at else []
+                
+                timeline_events = init_events + gen_events + eval_events + pw_events + combine_events + done_events
                 
                 logger.info(f"[STATS] Persisting stats to database for run {run_id}: {result.fpf_stats}")
                 
@@ -513,8 +550,7 @@ async def execute_run_background(run_id: str, config: RunConfig):
                                 sdr_timeline_events.append(te)
                         
                         # Add timeline events to the source doc result before serializing
-                        if hasattr(sdr, 'timeline_events'):
-                            sdr.timeline_events = sdr_timeline_events
+                        sdr.timeline_events = sdr_timeline_events
                         
                         serialized = serialize_dataclass(sdr)
                         # Ensure timeline_events is in the serialized data
@@ -523,32 +559,43 @@ async def execute_run_background(run_id: str, config: RunConfig):
                         
                         source_doc_results_serialized[sdr_id] = serialized
                 
+                # Always-present core fields; optional sections are only added when non-empty
+                # (to_detail treats a missing key the same as an empty one).
+                results_summary = {
+                    "winner": result.winner_doc_id,
+                    "generated_count": len(result.generated_docs),
+                    "eval_count": len(result.single_eval_results or {}),
+                    "fpf_stats": result.fpf_stats,
+                    "generated_docs": generated_docs_info,
+                    "pre_combine_evals": pre_combine_evals,
+                    "pre_combine_evals_detailed": pre_combine_evals_detailed,
+                    "criteria_list": sorted(list(all_criteria)),
+                    "evaluator_list": sorted(list(all_evaluators)),
+                    "generation_events": generation_events,
+                    "timeline_events": timeline_events,
+                    "doc_generation_costs": doc_generation_costs,  # NEW: Per-document generation costs
+                    "doc_eval_costs": doc_eval_costs,  # NEW: Per-document per-judge evaluation costs
+                }
+                if result.combined_docs:
+                    results_summary["combined_doc_id"] = result.combined_docs[0].doc_id
+                    results_summary["combined_doc_ids"] = [cd.doc_id for cd in result.combined_docs]
+                if result.post_combine_eval_results:
+                    results_summary["post_combine_eval"] = serialize_dataclass(result.post_combine_eval_results)
+                if eval_scores:
+                    results_summary["eval_scores"] = eval_scores
+                if post_combine_evals:
+                    results_summary["post_combine_evals"] = post_combine_evals
+                    results_summary["post_combine_evals_detailed"] = post_combine_evals_detailed
+                if pairwise_data:
+                    results_summary["pairwise"] = pairwise_data
+                if eval_deviations:
+                    results_summary["eval_deviations"] = eval_deviations  # NEW: Judge deviations across all documents
+                if source_doc_results_serialized:
+                    results_summary["source_doc_results"] = source_doc_results_serialized  # NEW: Per-source-document results
+                
                 await run_repo.complete(
                     run_id, 
-                    results_summary={
-                        "winner": result.winner_doc_id,
-                        "generated_count": len(result.generated_docs),
-                        "eval_count": len(result.single_eval_results or {}),
-                        "fpf_stats": result.fpf_stats,
-                        "combined_doc_id": result.combined_docs[0].doc_id if result.combined_docs else None,
-                        "combined_doc_ids": [cd.doc_id for cd in result.combined_docs] if result.combined_docs else [],
-                        "post_combine_eval": serialize_dataclass(result.post_combine_eval_results) if result.post_combine_eval_results else None,
-                        "eval_scores": eval_scores,
-                        "generated_docs": generated_docs_info,
-                        "pre_combine_evals": pre_combine_evals,
-                        "post_combine_evals": post_combine_evals,
-                        "pairwise": pairwise_data,
-                        "pre_combine_evals_detailed": pre_combine_evals_detailed,
-                        "post_combine_evals_detailed": post_combine_evals_detailed,
-                        "eval_deviations": eval_deviations,  # NEW: Judge deviations across all documents
-                        "criteria_list": sorted(list(all_criteria)),
-                        "evaluator_list": sorted(list(all_evaluators)),
-                        "generation_events": generation_events,
-                        "timeline_events": timeline_events,
-                        "source_doc_results": source_doc_results_serialized,  # NEW: Per-source-document results
-                        "doc_generation_costs": doc_generation_costs,  # NEW: Per-document generation costs
-                        "doc_eval_costs": doc_eval_costs,  # NEW: Per-document per-judge evaluation costs
-                    },
+                    results_summary=results_summary,
                     total_cost_usd=result.total_cost_usd
                 )
                 logger.info(f"Run {run_id} completed successfully")
@@ -560,126 +607,194 @@ async def execute_run_background(run_id: str, config: RunConfig):
                 await run_repo.fail(run_id, error_message=final_error)
                 logger.error(f"Run {run_id} failed: {final_error}")
                 
+    except asyncio.CancelledError:
+        # The task itself was cancelled (e.g. shutdown); user cancels go through
+        # executor.cancel() instead. Record the failure so the run is not left RUNNING,
+        # shielded so the write survives a repeated cancel, then let cancellation proceed.
+        logger.warning("Background task for run %s was cancelled", run_id)
+        await asyncio.shield(_persist_failure(config.user_uuid, run_id, "Run task was cancelled"))
+        raise
     except Exception as e:
         logger.exception(f"Unexpected error executing run {run_id}")
-        async with get_user_session_by_uuid(config.user_uuid) as session:
-            run_repo = RunRepository(session, user_uuid=config.user_uuid)
-            await run_repo.fail(run_id, error_message=str(e))
+        await _persist_failure(config.user_uuid, run_id, str(e))
     finally:
-        try:
-            popped = _active_executors.pop(run_id, None)
-            logger.debug(f"Executor cleanup for run {run_id}; popped={bool(popped)}")
-        except Exception:
-            logger.exception("Failed to pop active executor")
-        if run_logger:
-            for handler in run_logger.handlers:
-                try:
-                    handler.flush()
-                    handler.close()
-                except Exception:
-                    logger.exception("Failed to close run logger handler")
+        _cleanup_run(run_id, run_logger)
 
 
-@router.post("/runs/{run_id}/start")
-async def start_run(
-    run_id: str,
-    background_tasks: BackgroundTasks,
-    user: Dict[str, Any] = Depends(get_current_user),
-    db: AsyncSession = Depends(get_user_db)
-) -> dict:
-    """
-    Start executing a run.
+# run.config keys that feed the preset-derived part of the executor config
+_TEMPLATE_RUN_CONFIG_KEYS = (
+    "config_overrides",
+    "combine_config",
+    "eval_config",
+    "pairwise_config",
+    "fpf_config",
+    "gptr_config",
+    "dr_config",
+    "generators",
+    "models",
+    "iterations",
+    "evaluation_enabled",
+    "pairwise_enabled",
+    "log_level",
+    "post_combine_top_n",
+    "expose_criteria_to_generators",
+)
+
+# Preset columns (set directly by the GUI) that feed the executor config
+_TEMPLATE_PRESET_COLUMNS = (
+    "generation_concurrency",
+    "eval_concurrency",
+    "request_timeout",
+    "fpf_max_retries",
+    "fpf_retry_delay",
+    "eval_retries",
+)
+
+
+# One bit per generator the executor knows (values of app.adapters.base.GeneratorType)
+_GENERATOR_BITS = {g.value: 1 << i for i, g in enumerate(AdapterGeneratorType)}
+
+
+# Fields every preset must set, as (section, key) pairs checked in order.
+# Error messages name the field as "<section>.<key>".
+_REQUIRED_PRESET_FIELDS = (
+    ("preset", "eval_retries"),
+    ("eval_config", "temperature"),
+    ("eval_config", "max_tokens"),
+    ("eval_config", "strict_json"),
+)
+
+
+def _validate_required_fields(sections: dict[str, dict]) -> None:
+    """Raise ValueError for the first required preset field that is missing or None."""
+    for section, key in _REQUIRED_PRESET_FIELDS:
+        if sections[section].get(key) is None:
+            raise ValueError(f"{section}.{key} must be set in preset")
+
+
+@dataclass(frozen=True)
+class _ExecutorTemplate:
+    """Validated, preset-derived RunConfig fields shared by every run of a preset version."""
+    generators: tuple[str, ...]
+    model_names: tuple[str, ...]
+    model_settings: dict[str, dict]
+    fpf_model_keys: Optional[tuple[str, ...]]
+    gptr_model_keys: Optional[tuple[str, ...]]
+    dr_model_keys: Optional[tuple[str, ...]]
+    iterations: int
+    eval_enabled: bool
+    pairwise_enabled: bool
+    eval_iterations: int
+    judge_models: tuple[str, ...]
+    eval_retries: int
+    eval_temperature: float
+    eval_max_tokens: int
+    eval_strict_json: bool
+    eval_timeout: Optional[int]
+    pairwise_top_n: Optional[int]
+    combine_enabled: bool
+    combine_strategy: str
+    combine_models: tuple
+    combine_max_tokens: Optional[int]
+    post_combine_top_n: Optional[int]
+    expose_criteria_to_generators: bool
+    log_level: str
+    generation_concurrency: int
+    eval_concurrency: int
+    request_timeout: Optional[int]
+    fpf_max_retries: int
+    fpf_retry_delay: float
+
+    def run_config_kwargs(self) -> dict[str, Any]:
+        """RunConfig keyword arguments, with fresh mutable containers for this run."""
+        return {
+            "generators": [AdapterGeneratorType(g) for g in self.generators],
+            "models": list(self.model_names),
+            # RunConfig.__post_init__ writes into model_settings, so never hand out the cached dicts
+            "model_settings": {k: dict(v) for k, v in self.model_settings.items()},
+            "fpf_models": list(self.fpf_model_keys) if self.fpf_model_keys else None,
+            "gptr_models": list(self.gptr_model_keys) if self.gptr_model_keys else None,
+            "dr_models": list(self.dr_model_keys) if self.dr_model_keys else None,
+            "iterations": self.iterations,
+            "enable_single_eval": self.eval_enabled,
+            "enable_pairwise": self.pairwise_enabled,
+            "eval_iterations": self.eval_iterations,
+            "eval_judge_models": list(self.judge_models),
+            "eval_retries": self.eval_retries,
+            "eval_temperature": self.eval_temperature,
+            "eval_max_tokens": self.eval_max_tokens,
+            "eval_strict_json": self.eval_strict_json,
+            "eval_timeout": self.eval_timeout,
+            "pairwise_top_n": self.pairwise_top_n,
+            "enable_combine": self.combine_enabled,
+            "combine_strategy": self.combine_strategy,
+            "combine_models": list(self.combine_models),
+            "combine_max_tokens": self.combine_max_tokens,
+            "post_combine_top_n": self.post_combine_top_n,
+            "expose_criteria_to_generators": self.expose_criteria_to_generators,
+            "log_level": self.log_level,
+            "generation_concurrency": self.generation_concurrency,
+            "eval_concurrency": self.eval_concurrency,
+            "request_timeout": self.request_timeout,
+            "fpf_max_retries": self.fpf_max_retries,
+            "fpf_retry_delay": self.fpf_retry_delay,
+        }
+
+
+# Validated executor templates keyed by a digest of their settings payload. Bounded;
+# the oldest entry is evicted first.
+_EXECUTOR_TEMPLATE_CACHE_SIZE = 256
+_validated_templates: dict[str, _ExecutorTemplate] = {}
+
+
+def _executor_template_settings_json(run_config: dict, preset) -> str:
+    """Canonical JSON of every input to _build_executor_template."""
+    return json.dumps(
+        {
+            "run_config": {k: run_config[k] for k in _TEMPLATE_RUN_CONFIG_KEYS if k in run_config},
+            "preset": {k: getattr(preset, k) for k in _TEMPLATE_PRESET_COLUMNS},
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _get_executor_template(run_config: dict, preset) -> _ExecutorTemplate:
+    """Return the validated executor template for these settings, validating only once.
+
+    Keyed by a hash of the validated payload rather than the preset's id/version, so an
+    edit that does not touch run settings (e.g. a rename) still skips re-validation.
     """
-    repo = RunRepository(db, user_uuid=user['uuid'])
-    run = await repo.get_by_id(run_id)
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
-    
-    if run.status != RunStatus.PENDING:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Can only start PENDING runs, current status: {run.status}"
-        )
-    
-    if not run.preset_id:
-        raise HTTPException(status_code=400, detail="Cannot start run: run was not created from a preset")
+    settings_json = _executor_template_settings_json(run_config, preset)
+    digest = hashlib.blake2b(settings_json.encode(), digest_size=16).hexdigest()
+    template = _validated_templates.get(digest)
+    if template is None:
+        template = _build_executor_template(settings_json)
+        if len(_validated_templates) >= _EXECUTOR_TEMPLATE_CACHE_SIZE:
+            del _validated_templates[next(iter(_validated_templates))]
+        _validated_templates[digest] = template
+    return template
 
-    from app.infra.db.repositories import PresetRepository
-    preset_repo = PresetRepository(db, user_uuid=user['uuid'])
-    preset = await preset_repo.get_by_id(run.preset_id)
-    if not preset:
-        raise HTTPException(status_code=404, detail=f"Preset {run.preset_id} not found for this run")
-    
-    # NOTE: repo.start(run_id) is called AFTER all validation succeeds (before background task)
-    
-    run_config = run.config or {}
-    
-    # Fetch documents from Content Library
-    content_repo = ContentRepository(db, user_uuid=user['uuid'])
-    document_contents = {}
-    doc_ids = run_config.get("document_ids") or []
-    
-    for doc_id in doc_ids:
-        content = await content_repo.get_by_id(doc_id)
-        if content and content.content_type == "input_document":
-            logger.info(f"Document found in Content Library: {doc_id} -> {content.name}")
-            document_contents[doc_id] = content.body
-        else:
-            logger.warning(f"Document {doc_id} not found in Content Library")
+
+def _build_executor_template(settings_json: str) -> _ExecutorTemplate:
+    """Validate a preset's run settings and derive the preset-level executor config.
+
+    Raises ValueError on an incomplete preset. Use _get_executor_template, which
+    caches the result.
+    """
+    settings = json.loads(settings_json)
+    run_config = settings["run_config"]
+    preset = settings["preset"]
 
     # Get phase-specific configs
-    combine_config = run_config.get("combine_config", {}) or run_config.get("config_overrides", {}).get("combine", {})
-    eval_config = run_config.get("eval_config", {}) or run_config.get("config_overrides", {}).get("eval", {})
-    pairwise_config = run_config.get("pairwise_config", {}) or run_config.get("config_overrides", {}).get("pairwise", {})
-    concurrency_config = run_config.get("concurrency_config", {}) or run_config.get("config_overrides", {}).get("concurrency", {})
-    fpf_config = run_config.get("fpf_config", {}) or run_config.get("config_overrides", {}).get("fpf", {})
-    gptr_config = run_config.get("gptr_config", {}) or run_config.get("config_overrides", {}).get("gptr", {})
-    dr_config = run_config.get("dr_config", {}) or run_config.get("config_overrides", {}).get("dr", {})
-    
-    # Get generation instructions - NO FALLBACKS
-    generation_instructions_id = run_config.get("generation_instructions_id")
-    if not generation_instructions_id:
-        raise ValueError("No generation_instructions_id in run_config - you MUST set this in the GUI")
-    content = await content_repo.get_by_id(generation_instructions_id)
-    if not content or not content.body:
-        raise ValueError(f"Generation instructions content not found or empty (id={generation_instructions_id})")
-    instructions = content.body
-    logger.info(f"Loaded generation instructions from Content Library: {content.name}")
-    
-    # Fetch custom instruction content
-    single_eval_instructions = None
-    pairwise_eval_instructions = None
-    eval_criteria = None
-    combine_instructions = None
-    
-    single_eval_id = run_config.get("single_eval_instructions_id")
-    if single_eval_id:
-        content = await content_repo.get_by_id(single_eval_id)
-        if content:
-            single_eval_instructions = content.body
-            logger.info(f"Loaded single eval instructions from Content Library: {content.name}")
-    
-    pairwise_eval_id = run_config.get("pairwise_eval_instructions_id")
-    if pairwise_eval_id:
-        content = await content_repo.get_by_id(pairwise_eval_id)
-        if content:
-            pairwise_eval_instructions = content.body
-            logger.info(f"Loaded pairwise eval instructions from Content Library: {content.name}")
-    
-    eval_criteria_id = run_config.get("eval_criteria_id")
-    if eval_criteria_id:
-        content = await content_repo.get_by_id(eval_criteria_id)
-        if content:
-            eval_criteria = content.body
-            logger.info(f"Loaded eval criteria from Content Library: {content.name}")
-    
-    combine_instructions_id = run_config.get("combine_instructions_id")
-    if combine_instructions_id:
-        content = await content_repo.get_by_id(combine_instructions_id)
-        if content:
-            combine_instructions = content.body
-            logger.info(f"Loaded combine instructions from Content Library: {content.name}")
-    
+    config_overrides = run_config.get("config_overrides") or {}
+    combine_config = run_config.get("combine_config", {}) or config_overrides.get("combine", {})
+    eval_config = run_config.get("eval_config", {}) or config_overrides.get("eval", {})
+    pairwise_config = run_config.get("pairwise_config", {}) or config_overrides.get("pairwise", {})
+    fpf_config = run_config.get("fpf_config", {}) or config_overrides.get("fpf", {})
+    gptr_config = run_config.get("gptr_config", {}) or config_overrides.get("gptr", {})
+    dr_config = run_config.get("dr_config", {}) or config_overrides.get("dr", {})
+
     generators = run_config.get("generators") or []
     models = run_config.get("models") or []
     iterations = run_config.get("iterations", 1)
@@ -694,164 +809,286 @@ async def start_run(
     combine_max_tokens = combine_config.get("max_tokens", 4096)
     log_level = run_config.get("log_level", "INFO")
     # Read concurrency settings from preset's direct database columns (set by GUI)
-    gen_concurrency = preset.generation_concurrency or 3
-    eval_concurrency_val = preset.eval_concurrency or 2
-    request_timeout = preset.request_timeout or 120
+    gen_concurrency = preset["generation_concurrency"] or 3
+    eval_concurrency_val = preset["eval_concurrency"] or 2
+    request_timeout = preset["request_timeout"] or 120
     
     # Read FPF retry settings from preset's direct database columns (set by GUI)
-    fpf_max_retries = preset.fpf_max_retries or 3
-    fpf_retry_delay = preset.fpf_retry_delay or 2
+    fpf_max_retries = preset["fpf_max_retries"] or 3
+    fpf_retry_delay = preset["fpf_retry_delay"] or 2
     
-    def extract_model_keys(selected_models_list):
-        """Convert selected_models list to model key strings."""
+    invalid_keys: list[str] = []
+
+    def extract_model_tuples(selected_models_list) -> Optional[list[tuple[str, str]]]:
+        """Convert a selected_models list to (provider, model) tuples."""
         if not selected_models_list:
             return None
-        keys = []
+        tuples = []
         for entry in selected_models_list:
             if isinstance(entry, dict):
                 p = entry.get("provider")
                 m = entry.get("model")
                 if p and m:
-                    keys.append(f"{p}:{m}")
+                    tuples.append((p, m))
             elif isinstance(entry, str):
-                keys.append(entry)
-        return keys if keys else None
-    
-    fpf_model_keys = extract_model_keys(fpf_config.get("selected_models"))
-    gptr_model_keys = extract_model_keys(gptr_config.get("selected_models"))
-    dr_model_keys = extract_model_keys(dr_config.get("selected_models"))
+                p, sep, m = entry.partition(":")
+                if sep and p and m:
+                    tuples.append((p, m))
+                else:
+                    invalid_keys.append(entry)
+        return tuples if tuples else None
 
-    enabled_generators = set(generators)
-    if "fpf" in enabled_generators and not fpf_model_keys:
+    fpf_models = extract_model_tuples(fpf_config.get("selected_models"))
+    gptr_models = extract_model_tuples(gptr_config.get("selected_models"))
+    dr_models = extract_model_tuples(dr_config.get("selected_models"))
+    if invalid_keys:
+        raise ValueError(f"Model keys {invalid_keys} are invalid; expected provider:model")
+
+    unknown_generators = [g for g in generators if g not in _GENERATOR_BITS]
+    if unknown_generators:
+        raise ValueError(f"Unknown generators in preset: {unknown_generators}")
+    enabled_mask = 0
+    for g in generators:
+        enabled_mask |= _GENERATOR_BITS[g]
+    if enabled_mask & _GENERATOR_BITS["fpf"] and not fpf_models:
         raise ValueError("FPF enabled but no FPF selected_models set in preset")
-    if "gptr" in enabled_generators and not gptr_model_keys:
+    if enabled_mask & _GENERATOR_BITS["gptr"] and not gptr_models:
         raise ValueError("GPTR enabled but no GPTR selected_models set in preset")
-    if "dr" in enabled_generators and not dr_model_keys:
+    if enabled_mask & _GENERATOR_BITS["dr"] and not dr_models:
         raise ValueError("DR enabled but no DR selected_models set in preset")
     
-    logger.info(f"Per-generator models - FPF: {len(fpf_model_keys or [])} models, GPTR: {len(gptr_model_keys or [])} models, DR: {len(dr_model_keys or [])} models")
-
-    # Model settings keyed by model key (provider:model)
-    # When same model is used by multiple generators, FPF settings take priority (since FPF uses max_tokens)
-    model_settings: dict[str, dict] = {}
-    model_names: list[str] = []
+    logger.info(
+        "Per-generator models - FPF: %s models, GPTR: %s models, DR: %s models",
+        len(fpf_models or []), len(gptr_models or []), len(dr_models or []),
+    )
 
-    def add_models_for_generator(model_keys: Optional[list[str]], generator_config: dict, label: str, require_max_tokens: bool = True):
-        if not model_keys:
-            return
-        temperature = generator_config.get("temperature")
-        max_tokens = generator_config.get("max_tokens")
-        if temperature is None:
+    generator_models = [
+        ("FPF", fpf_models or [], fpf_config, True),
+        ("GPTR", gptr_models or [], gptr_config, False),  # GPTR uses its own token limits
+        ("DR", dr_models or [], dr_config, False),  # DR uses its own token limits
+    ]
+    for label, model_tuples, generator_config, require_max_tokens in generator_models:
+        if not model_tuples:
+            continue
+        if generator_config.get("temperature") is None:
             raise ValueError(f"{label} enabled but temperature is missing in preset")
         # Only FPF requires max_tokens; GPTR/DR use their own token limit configs
-        if require_max_tokens and max_tokens is None:
+        if require_max_tokens and generator_config.get("max_tokens") is None:
             raise ValueError(f"{label} enabled but max_tokens is missing in preset")
-        
-        # For GPTR/DR, use a fallback max_tokens value (won't actually be used, they use their own limits)
-        effective_max_tokens = max_tokens if max_tokens is not None else 8192
-        
-        for key in model_keys:
-            parts = key.split(":", 1)
-            if len(parts) != 2 or not parts[0] or not parts[1]:
-                raise ValueError(f"Model key {key} is invalid; expected provider:model")
-            provider, base_model = parts
-            settings = {
-                "provider": provider,
-                "model": base_model,
-                "temperature": temperature,
-                "max_tokens": effective_max_tokens,
-            }
-            # If model already exists (from another generator), only override if this is FPF (FPF needs accurate max_tokens)
-            if key in model_settings:
-                if require_max_tokens:  # This is FPF - its settings take priority
-                    model_settings[key] = settings
-                # else: keep existing settings (from FPF if already set)
-            else:
-                model_settings[key] = settings
-            model_names.append(key)
 
-    # Process FPF first so its max_tokens values take priority
-    add_models_for_generator(fpf_model_keys, fpf_config, "FPF", require_max_tokens=True)
-    add_models_for_generator(gptr_model_keys, gptr_config, "GPTR", require_max_tokens=False)  # GPTR uses its own token limits
-    add_models_for_generator(dr_model_keys, dr_config, "DR", require_max_tokens=False)  # DR uses its own token limits
+    def settings_for(provider: str, base_model: str, generator_config: dict) -> dict:
+        max_tokens = generator_config.get("max_tokens")
+        return {
+            "provider": provider,
+            "model": base_model,
+            "temperature": generator_config["temperature"],
+            # For GPTR/DR, use a fallback max_tokens value (won't actually be used, they use their own limits)
+            "max_tokens": max_tokens if max_tokens is not None else 8192,
+        }
+
+    def model_keys(model_tuples: Optional[list[tuple[str, str]]]) -> Optional[tuple[str, ...]]:
+        return tuple(f"{p}:{m}" for p, m in model_tuples) if model_tuples else None
 
-    model_names = sorted(set(model_names))
+    # Model settings keyed by model key (provider:model)
+    # When same model is used by multiple generators, FPF settings take priority (since FPF uses max_tokens)
+    model_settings: dict[str, dict] = {
+        f"{p}:{m}": settings_for(p, m, fpf_config) for p, m in fpf_models or []
+    }
+    for _, model_tuples, generator_config, _ in generator_models[1:]:
+        for p, m in model_tuples:
+            key = f"{p}:{m}"
+            if key not in model_settings:
+                model_settings[key] = settings_for(p, m, generator_config)
+
+    model_names = sorted(model_settings)
     if not model_names:
         raise ValueError("No models configured for enabled generators in preset")
 
     if models:
-        model_keys_from_models = set()
-        for model_entry in models:
-            provider = model_entry.get("provider")
-            base_model = model_entry.get("model")
-            if provider and base_model:
-                model_keys_from_models.add(f"{provider}:{base_model}")
-            else:
-                raise ValueError(f"Model entry missing provider/model: {model_entry}")
-        extra_models = model_keys_from_models - set(model_names)
+        bad_entries = [m for m in models if not (m.get("provider") and m.get("model"))]
+        if bad_entries:
+            raise ValueError(f"Model entries missing provider/model: {bad_entries}")
+        extra_models = {f"{m['provider']}:{m['model']}" for m in models}.difference(model_settings)
         if extra_models:
             raise ValueError(f"Global models not bound to generators: {sorted(extra_models)}")
 
-    logger.info(f"Built model_settings for {len(model_settings)} unique models")
+    logger.info("Built model_settings for %s unique models", len(model_settings))
 
-    eval_temperature = eval_config.get("temperature")
-    eval_max_tokens = eval_config.get("max_tokens")
     # Read eval_retries from preset's direct database column (set by GUI)
-    eval_retries = preset.eval_retries
-    if eval_retries is None:
-        raise ValueError("preset.eval_retries must be set in preset")
-    if eval_temperature is None:
-        raise ValueError("eval_config.temperature must be set in preset")
-    if eval_max_tokens is None:
-        raise ValueError("eval_config.max_tokens must be set in preset")
-    eval_strict_json = eval_config.get("strict_json")
-    if eval_strict_json is None:
-        raise ValueError("eval_config.strict_json must be set in preset")
+    _validate_required_fields({"preset": preset, "eval_config": eval_config})
+    eval_retries = preset["eval_retries"]
+    eval_temperature = eval_config["temperature"]
+    eval_max_tokens = eval_config["max_tokens"]
+    eval_strict_json = eval_config["strict_json"]
 
-    executor_config = RunConfig(
-        user_uuid=user['uuid'],  # User UUID for fetching encrypted provider API keys
-        document_ids=list(document_contents.keys()),
-        document_contents=document_contents,
-        instructions=instructions,
-        generators=[AdapterGeneratorType(g) for g in generators],
-        models=model_names,
+    return _ExecutorTemplate(
+        generators=tuple(generators),
+        model_names=tuple(model_names),
         model_settings=model_settings,
-        fpf_models=fpf_model_keys,
-        gptr_models=gptr_model_keys,
-        dr_models=dr_model_keys,
+        fpf_model_keys=model_keys(fpf_models),
+        gptr_model_keys=model_keys(gptr_models),
+        dr_model_keys=model_keys(dr_models),
         iterations=iterations,
-        enable_single_eval=eval_enabled,
-        enable_pairwise=pairwise_enabled,
+        eval_enabled=eval_enabled,
+        pairwise_enabled=pairwise_enabled,
         eval_iterations=eval_iterations,
-        eval_judge_models=judge_models,
+        judge_models=tuple(judge_models),
         eval_retries=eval_retries,
         eval_temperature=eval_temperature,
         eval_max_tokens=eval_max_tokens,
         eval_strict_json=eval_strict_json,
         eval_timeout=eval_timeout,
         pairwise_top_n=eval_config.get("pairwise_top_n"),
-        single_eval_instructions=single_eval_instructions,
-        pairwise_eval_instructions=pairwise_eval_instructions,
-        eval_criteria=eval_criteria,
-        enable_combine=combine_enabled,
+        combine_enabled=combine_enabled,
         combine_strategy=combine_strategy,
-        combine_models=combine_models_list,
-        combine_instructions=combine_instructions,
+        combine_models=tuple(combine_models_list),
         combine_max_tokens=combine_max_tokens,
         post_combine_top_n=run_config.get("post_combine_top_n"),
         expose_criteria_to_generators=run_config["expose_criteria_to_generators"],
         log_level=log_level,
-        fpf_log_output="file",
-        fpf_log_file_path=str(get_fpf_log_path(user['uuid'], run_id)),
         generation_concurrency=gen_concurrency,
         eval_concurrency=eval_concurrency_val,
         request_timeout=request_timeout,
         fpf_max_retries=fpf_max_retries,
         fpf_retry_delay=fpf_retry_delay,
     )
+
+
+async def _start_and_execute_run(run_id: str, config: RunConfig) -> None:
+    """Mark a validated run RUNNING, then execute it.
+
+    Runs as the background task so start_run can respond without waiting on this write.
+    The PENDING -> RUNNING check is a single conditional UPDATE, so a duplicate start
+    request cannot launch a second execution.
+    """
+    async with get_user_session_by_uuid(config.user_uuid) as session:
+        run_repo = RunRepository(session, user_uuid=config.user_uuid)
+        started = await run_repo.transition(
+            run_id, (RunStatus.PENDING,), RunStatus.RUNNING, started_at=func.now()
+        )
+    if not started:
+        logger.warning("Run %s is no longer PENDING; skipping execution", run_id)
+        return
+    await execute_run_background(run_id, config)
+
+
+@router.post("/runs/{run_id}/start")
+async def start_run(
+    run_id: str,
+    background_tasks: BackgroundTasks,
+    user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_user_db)
+) -> dict:
+    """
+    Start executing a run.
+    """
+    repo = RunRepository(db, user_uuid=user['uuid'])
+    # The run and its preset are loaded in one round-trip. Independent awaits here cannot be
+    # overlapped with asyncio.gather because they all share the request's AsyncSession.
+    run = await repo.get_with_preset(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
     
-    # Set status to RUNNING only after all validation succeeds
-    await repo.start(run_id)
+    if run.status != RunStatus.PENDING:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Can only start PENDING runs, current status: {run.status}"
+        )
+    
+    if not run.preset_id:
+        raise HTTPException(status_code=400, detail="Cannot start run: run was not created from a preset")
+
+    preset = run.preset
+    if not preset or preset.user_uuid != user['uuid']:
+        raise HTTPException(status_code=404, detail=f"Preset {run.preset_id} not found for this run")
+    
+    # NOTE: the run is only marked RUNNING by the background task, after all validation succeeds
+    
+    run_config = run.config or {}
+    
+    # Get generation instructions - NO FALLBACKS
+    generation_instructions_id = run_config.get("generation_instructions_id")
+    if not generation_instructions_id:
+        raise ValueError("No generation_instructions_id in run_config - you MUST set this in the GUI")
+    single_eval_id = run_config.get("single_eval_instructions_id")
+    pairwise_eval_id = run_config.get("pairwise_eval_instructions_id")
+    eval_criteria_id = run_config.get("eval_criteria_id")
+    combine_instructions_id = run_config.get("combine_instructions_id")
+    
+    # Fetch input documents and all instruction content from the Content Library in at most
+    # one query (recently loaded entries are served from the repository's snapshot cache)
+    content_repo = ContentRepository(db, user_uuid=user['uuid'])
+    doc_ids = run_config.get("document_ids") or []
+    contents = await content_repo.get_snapshots([
+        *doc_ids,
+        generation_instructions_id,
+        single_eval_id,
+        pairwise_eval_id,
+        eval_criteria_id,
+        combine_instructions_id,
+    ])
+    
+    document_contents = {}
+    for doc_id in doc_ids:
+        content = contents.get(doc_id)
+        if content and content.content_type == "input_document":
+            logger.info("Document found in Content Library: %s -> %s", doc_id, content.name)
+            document_contents[doc_id] = content.body
+        else:
+            logger.warning("Document %s not found in Content Library", doc_id)
+    
+    content = contents.get(generation_instructions_id)
+    if not content or not content.body:
+        raise ValueError(f"Generation instructions content not found or empty (id={generation_instructions_id})")
+    instructions = content.body
+    logger.info("Loaded generation instructions from Content Library: %s", content.name)
+    
+    # Resolve custom instruction content
+    single_eval_instructions = None
+    pairwise_eval_instructions = None
+    eval_criteria = None
+    combine_instructions = None
+    
+    content = contents.get(single_eval_id) if single_eval_id else None
+    if content:
+        single_eval_instructions = content.body
+        logger.info("Loaded single eval instructions from Content Library: %s", content.name)
+    
+    content = contents.get(pairwise_eval_id) if pairwise_eval_id else None
+    if content:
+        pairwise_eval_instructions = content.body
+        logger.info("Loaded pairwise eval instructions from Content Library: %s", content.name)
+    
+    content = contents.get(eval_criteria_id) if eval_criteria_id else None
+    if content:
+        eval_criteria = content.body
+        logger.info("Loaded eval criteria from Content Library: %s", content.name)
+    
+    content = contents.get(combine_instructions_id) if combine_instructions_id else None
+    if content:
+        combine_instructions = content.body
+        logger.info("Loaded combine instructions from Content Library: %s", content.name)
+    
+    # Preset-derived settings are validated once per distinct settings payload and cached;
+    # only the per-run inputs are overlaid here.
+    try:
+        template = _get_executor_template(run_config, preset)
+    except ValueError as e:
+        # An incomplete preset is a client error, not a server fault
+        raise HTTPException(status_code=400, detail=str(e))
+    executor_config = RunConfig(
+        user_uuid=user['uuid'],  # User UUID for fetching encrypted provider API keys
+        document_ids=list(document_contents.keys()),
+        document_contents=document_contents,
+        instructions=instructions,
+        single_eval_instructions=single_eval_instructions,
+        pairwise_eval_instructions=pairwise_eval_instructions,
+        eval_criteria=eval_criteria,
+        combine_instructions=combine_instructions,
+        fpf_log_output="file",
+        fpf_log_file_path=str(get_fpf_log_path(user['uuid'], run_id)),
+        **template.run_config_kwargs(),
+    )
     
     # Initialize source_doc_results for immediate frontend display
     # This MUST happen before background task so frontend sees collapsible sections immediately
@@ -874,14 +1111,35 @@ async def start_run(
     
     # Save to DB before returning so frontend can fetch it
     await repo.update(run_id, results_summary={"source_doc_results": source_doc_results_init})
-    logger.info(f"[INIT] Pre-initialized source_doc_results with {len(document_contents)} input documents")
+    logger.info("[INIT] Pre-initialized source_doc_results with %s input documents", len(document_contents))
     
-    background_tasks.add_task(execute_run_background, run_id, executor_config)
+    background_tasks.add_task(_start_and_execute_run, run_id, executor_config)
     
     return {"status": "started", "run_id": run_id}
 
 
 
+async def _transition_or_raise(
+    repo: RunRepository,
+    run_id: str,
+    from_states: tuple[RunStatus, ...],
+    to_state: RunStatus,
+    error_detail: str,
+    **values
+) -> None:
+    """Apply a run status transition, raising 404/400 if it does not apply.
+
+    The status check and write are one UPDATE; only the status column is re-read on
+    failure, to tell a missing run from one in the wrong state.
+    """
+    if await repo.transition(run_id, from_states, to_state, **values):
+        return
+    status = await repo.get_status(run_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    raise HTTPException(status_code=400, detail=f"{error_detail}: {status}")
+
+
 @router.post("/runs/{run_id}/pause")
 async def pause_run(
     run_id: str,
@@ -892,17 +1150,10 @@ async def pause_run(
     Pause a running run.
     """
     repo = RunRepository(db, user_uuid=user['uuid'])
-    run = await repo.get_by_id(run_id)
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
-    
-    if run.status != RunStatus.RUNNING:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Can only pause RUNNING runs, current status: {run.status}"
-        )
-    
-    await repo.update(run_id, status=RunStatus.PAUSED)
+    await _transition_or_raise(
+        repo, run_id, (RunStatus.RUNNING,), RunStatus.PAUSED,
+        "Can only pause RUNNING runs, current status",
+    )
     return {"status": "paused", "run_id": run_id}
 
 
@@ -916,17 +1167,10 @@ async def resume_run(
     Resume a paused run.
     """
     repo = RunRepository(db, user_uuid=user['uuid'])
-    run = await repo.get_by_id(run_id)
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
-    
-    if run.status != RunStatus.PAUSED:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Can only resume PAUSED runs, current status: {run.status}"
-        )
-    
-    await repo.update(run_id, status=RunStatus.RUNNING)
+    await _transition_or_raise(
+        repo, run_id, (RunStatus.PAUSED,), RunStatus.RUNNING,
+        "Can only resume PAUSED runs, current status",
+    )
     return {"status": "running", "run_id": run_id}
 
 
@@ -940,22 +1184,18 @@ async def cancel_run(
     Cancel a running or paused run.
     """
     repo = RunRepository(db, user_uuid=user['uuid'])
-    run = await repo.get_by_id(run_id)
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
-    
-    if run.status not in (RunStatus.RUNNING, RunStatus.PAUSED, RunStatus.PENDING):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot cancel run in status: {run.status}"
-        )
+    # completed_at is stamped by the database in the same UPDATE (naive UTC, like the other run timestamps)
+    await _transition_or_raise(
+        repo, run_id, (RunStatus.RUNNING, RunStatus.PAUSED, RunStatus.PENDING), RunStatus.CANCELLED,
+        "Cannot cancel run in status",
+        completed_at=func.now(),
+    )
     
     executor = _active_executors.get(run_id)
     if executor:
-        logger.info(f"Signaling cancellation for run {run_id}")
+        logger.info("Signaling cancellation for run %s", run_id)
         executor.cancel()
     else:
-        logger.info(f"No active executor found for run {run_id}, just updating status")
+        logger.info("No active executor found for run %s, just updating status", run_id)
     
-    await repo.update(run_id, status=RunStatus.CANCELLED, completed_at=datetime.utcnow())
     return {"status": "cancelled", "run_id": run_id}
@@ -6,9 +6,9 @@ Stores arbitrary per-user settings as JSON in the user's database.
 from datetime import datetime
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, ConfigDict
+from fastapi import APIRouter, Body, Depends
 from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.middleware import get_current_user
@@ -18,12 +18,6 @@ from app.infra.db.session import get_user_db
 router = APIRouter(prefix="/settings", tags=["settings"])
 
 
-class SettingsPayload(BaseModel):
-    """Arbitrary settings payload."""
-
-    model_config = ConfigDict(extra="allow")
-
-
 @router.get("")
 async def get_settings(
     user: dict = Depends(get_current_user),
@@ -41,27 +35,24 @@ async def get_settings(
 
 @router.put("")
 async def update_settings(
-    payload: SettingsPayload,
+    payload: Dict[str, Any] = Body(...),
     user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_user_db),
 ) -> Dict[str, Any]:
-    """Update stored settings for the current user."""
-    settings_data = payload.model_dump()
-
-    result = await db.execute(
-        select(UserSettings).where(UserSettings.user_uuid == user["uuid"])
+    """Update stored settings for the current user.
+
+    The payload is an arbitrary JSON object and is stored as-is.
+    """
+    # Per-user databases are SQLite: upsert on the unique user_uuid in one statement
+    stmt = sqlite_insert(UserSettings).values(
+        user_uuid=user["uuid"],
+        settings=payload,
+        updated_at=datetime.utcnow(),
     )
-    settings_row = result.scalar_one_or_none()
-
-    if settings_row:
-        settings_row.settings = settings_data
-        settings_row.updated_at = datetime.utcnow()
-    else:
-        settings_row = UserSettings(
-            user_uuid=user["uuid"],
-            settings=settings_data,
-            updated_at=datetime.utcnow(),
-        )
-        db.add(settings_row)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserSettings.user_uuid],
+        set_={"settings": stmt.excluded.settings, "updated_at": stmt.excluded.updated_at},
+    )
+    await db.execute(stmt)
 
-    return settings_row.settings
\ No newline at end of file
+    return payload
@@ -14,28 +14,41 @@ AUTHENTICATION LOGIC:
   API keys CANNOT create users.
 - All other operations: Via API key (X-ACM2-API-Key header)
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Request
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Any, Dict, Optional
+import hashlib
+import json
 import logging
 import os
+import time
 import aiosqlite
 
-from app.auth.api_keys import generate_api_key, verify_api_key, extract_uuid
+from app.auth.api_keys import generate_api_key_async, verify_api_key, extract_uuid
 from app.auth.user_registry import (
     get_user_count, register_user, construct_db_path, user_exists, get_data_dir
 )
 from app.db.seed_user import initialize_user
-from app.auth.middleware import get_current_user
+from app.auth.middleware import forget_user, get_current_user
 from app.infra.db.session import get_user_session_by_uuid
 from app.infra.db.models.user_meta import UserMeta
 from app.config import get_settings, Settings
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Users"])
 
+# Built once; executed with {"uuid": ...}
+_USER_META_BY_UUID = select(UserMeta).where(UserMeta.uuid == bindparam("uuid"))
+
+# /users/me payloads of seeded users: uuid -> (expiry_timestamp, response_data).
+# Seeding never reverts, so a ready payload stays valid; the TTL bounds email staleness.
+_me_cache: Dict[str, tuple] = {}
+_ME_CACHE_TTL_SECONDS = 30
+_ME_CACHE_MAX_ENTRIES = 1024
+
 
 class CreateUserRequest(BaseModel):
     """Request model for creating a new user.
@@ -71,13 +84,13 @@ async def _resync_existing_user(user_uuid: str, user_data: CreateUserRequest) ->
     Instead of failing, we generate a fresh API key and return it.
     This allows the "Sync All Users" button to fix broken/old keys.
     """
-    logger.info(f"[RESYNC] Starting resync for user {user_uuid}")
+    logger.info("[RESYNC] Starting resync for user %s", user_uuid)
     
     db_path = construct_db_path(user_uuid)
     
     # Generate new API key with embedded UUID
-    plaintext_key, key_hash, key_prefix = generate_api_key(user_uuid)
-    logger.info(f"[RESYNC] New API key generated with prefix: {key_prefix}")
+    plaintext_key, key_hash, key_prefix = await generate_api_key_async(user_uuid)
+    logger.info("[RESYNC] New API key generated with prefix: %s", key_prefix)
     
     # Deactivate old keys and insert new one
     async with aiosqlite.connect(db_path) as conn:
@@ -111,7 +124,11 @@ async def _resync_existing_user(user_uuid: str, user_data: CreateUserRequest) ->
         await conn.commit()
         logger.info("[RESYNC] New API key saved, user_meta updated")
     
-    logger.info(f"[RESYNC] Resync complete for user {user_uuid}")
+    # Old keys are deactivated; don't keep accepting them from the auth cache
+    forget_user(user_uuid)
+    _me_cache.pop(user_uuid, None)
+    
+    logger.info("[RESYNC] Resync complete for user %s", user_uuid)
     
     return CreateUserResponse(
         uuid=user_uuid,
@@ -154,7 +171,7 @@ async def _authorize_user_creation(request: Request) -> Optional[dict]:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="ACM2_PLUGIN_SECRET not configured on backend. Add it to .env file."
         )
-    logger.info(f"[USER_CREATE] ACM2_PLUGIN_SECRET is configured (prefix: {settings.acm2_plugin_secret[:15]}...)")
+    logger.info("[USER_CREATE] ACM2_PLUGIN_SECRET is configured (prefix: %s...)", settings.acm2_plugin_secret[:15])
     
     # Validate plugin secret from request header
     logger.info("[USER_CREATE] Checking X-ACM2-Plugin-Secret header from request...")
@@ -167,14 +184,14 @@ async def _authorize_user_creation(request: Request) -> Optional[dict]:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User creation requires X-ACM2-Plugin-Secret header (WordPress only)"
         )
-    logger.info(f"[USER_CREATE] X-ACM2-Plugin-Secret header received (prefix: {plugin_secret[:15]}...)")
+    logger.info("[USER_CREATE] X-ACM2-Plugin-Secret header received (prefix: %s...)", plugin_secret[:15])
     
     # Compare secrets
     logger.info("[USER_CREATE] Comparing plugin secret from header with configured secret...")
     if plugin_secret != settings.acm2_plugin_secret:
         logger.error("[USER_CREATE] DENIED: Plugin secret does not match!")
-        logger.error(f"[USER_CREATE] Expected prefix: {settings.acm2_plugin_secret[:15]}...")
-        logger.error(f"[USER_CREATE] Received prefix: {plugin_secret[:15]}...")
+        logger.error("[USER_CREATE] Expected prefix: %s...", settings.acm2_plugin_secret[:15])
+        logger.error("[USER_CREATE] Received prefix: %s...", plugin_secret[:15])
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid plugin secret"
@@ -210,11 +227,11 @@ async def create_user(request: Request, user_data: CreateUserRequest):
     
     # Log ALL request details
     logger.info("[USER_CREATE] === REQUEST DETAILS ===")
-    logger.info(f"[USER_CREATE] Request method: {request.method}")
-    logger.info(f"[USER_CREATE] Request URL: {request.url}")
-    logger.info(f"[USER_CREATE] Request path: {request.url.path}")
-    logger.info(f"[USER_CREATE] Client host: {request.client.host if request.client else 'Unknown'}")
-    logger.info(f"[USER_CREATE] Client port: {request.client.port if request.client else 'Unknown'}")
+    logger.info("[USER_CREATE] Request method: %s", request.method)
+    logger.info("[USER_CREATE] Request URL: %s", request.url)
+    logger.info("[USER_CREATE] Request path: %s", request.url.path)
+    logger.info("[USER_CREATE] Client host: %s", request.client.host if request.client else 'Unknown')
+    logger.info("[USER_CREATE] Client port: %s", request.client.port if request.client else 'Unknown')
     
     # Log ALL headers
     logger.info("[USER_CREATE] === REQUEST HEADERS ===")
@@ -222,32 +239,32 @@ async def create_user(request: Request, user_data: CreateUserRequest):
         # Mask sensitive headers
         if 'secret' in header_name.lower() or 'key' in header_name.lower():
             masked_value = header_value[:20] + '...' if len(header_value) > 20 else header_value
-            logger.info(f"[USER_CREATE] Header: {header_name} = {masked_value}")
+            logger.info("[USER_CREATE] Header: %s = %s", header_name, masked_value)
         else:
-            logger.info(f"[USER_CREATE] Header: {header_name} = {header_value}")
+            logger.info("[USER_CREATE] Header: %s = %s", header_name, header_value)
     
     # Log request body (parsed)
     logger.info("[USER_CREATE] === REQUEST BODY (parsed) ===")
-    logger.info(f"[USER_CREATE] user_data type: {type(user_data)}")
-    logger.info(f"[USER_CREATE] user_data.uuid = {repr(user_data.uuid)}")
-    logger.info(f"[USER_CREATE] user_data.email = {repr(user_data.email)}")
+    logger.info("[USER_CREATE] user_data type: %s", type(user_data))
+    logger.info("[USER_CREATE] user_data.uuid = %r", user_data.uuid)
+    logger.info("[USER_CREATE] user_data.email = %r", user_data.email)
     
     # Log environment check
     logger.info("[USER_CREATE] === ENVIRONMENT CHECK ===")
     try:
         settings = get_settings()
-        logger.info(f"[USER_CREATE] Settings loaded successfully: {settings}")
-        logger.info(f"[USER_CREATE] settings.acm2_plugin_secret is set: {settings.acm2_plugin_secret is not None}")
+        logger.info("[USER_CREATE] Settings loaded successfully: %s", settings)
+        logger.info("[USER_CREATE] settings.acm2_plugin_secret is set: %s", settings.acm2_plugin_secret is not None)
         if settings.acm2_plugin_secret:
-            logger.info(f"[USER_CREATE] settings.acm2_plugin_secret prefix: {settings.acm2_plugin_secret[:20]}...")
+            logger.info("[USER_CREATE] settings.acm2_plugin_secret prefix: %s...", settings.acm2_plugin_secret[:20])
         else:
             logger.warning("[USER_CREATE] settings.acm2_plugin_secret is None/empty!")
-        logger.info(f"[USER_CREATE] settings.encryption_key is set: {settings.encryption_key is not None}")
-        logger.info(f"[USER_CREATE] settings.seed_preset_id = {settings.seed_preset_id}")
-        logger.info(f"[USER_CREATE] settings.seed_version = {settings.seed_version}")
+        logger.info("[USER_CREATE] settings.encryption_key is set: %s", settings.encryption_key is not None)
+        logger.info("[USER_CREATE] settings.seed_preset_id = %s", settings.seed_preset_id)
+        logger.info("[USER_CREATE] settings.seed_version = %s", settings.seed_version)
     except Exception as e:
-        logger.error(f"[USER_CREATE] ERROR loading settings: {e}")
-        logger.error(f"[USER_CREATE] Settings traceback:\n{tb.format_exc()}")
+        logger.error("[USER_CREATE] ERROR loading settings: %s", e)
+        logger.error("[USER_CREATE] Settings traceback:\n%s", tb.format_exc())
         raise HTTPException(status_code=500, detail=f"Failed to load settings: {e}")
     
     # Authorize the request (plugin secret only - WordPress only)
@@ -257,32 +274,32 @@ async def create_user(request: Request, user_data: CreateUserRequest):
     
     try:
         authenticated_user = await _authorize_user_creation(request)
-        logger.info(f"[USER_CREATE] _authorize_user_creation() returned: {authenticated_user}")
+        logger.info("[USER_CREATE] _authorize_user_creation() returned: %s", authenticated_user)
     except HTTPException as he:
-        logger.error(f"[USER_CREATE] Authorization failed with HTTPException: {he.status_code} - {he.detail}")
+        logger.error("[USER_CREATE] Authorization failed with HTTPException: %s - %s", he.status_code, he.detail)
         raise
     except Exception as e:
-        logger.error(f"[USER_CREATE] Authorization failed with unexpected error: {e}")
-        logger.error(f"[USER_CREATE] Authorization traceback:\n{tb.format_exc()}")
+        logger.error("[USER_CREATE] Authorization failed with unexpected error: %s", e)
+        logger.error("[USER_CREATE] Authorization traceback:\n%s", tb.format_exc())
         raise
     
     if authenticated_user:
-        logger.info(f"[USER_CREATE] Authorized by existing user: {authenticated_user['uuid']}")
+        logger.info("[USER_CREATE] Authorized by existing user: %s", authenticated_user['uuid'])
     else:
         logger.info("[USER_CREATE] Authorized by plugin secret (first user creation)")
     
     is_first_user = authenticated_user is None  # If no authenticated user, this is first user via plugin secret
-    logger.info(f"[USER_CREATE] is_first_user = {is_first_user}")
+    logger.info("[USER_CREATE] is_first_user = %s", is_first_user)
     
     try:
         # UUID comes from WordPress frontend - it is the sole identifier
         logger.info("[USER_CREATE] === PROCESSING UUID ===")
         user_uuid = user_data.uuid.lower()  # Normalize to lowercase
-        logger.info(f"[USER_CREATE] User UUID: {user_uuid}")
+        logger.info("[USER_CREATE] User UUID: %s", user_uuid)
         
         # Check if this user already exists - if so, resync (generate new key)
         if user_exists(user_uuid):
-            logger.info(f"[USER_CREATE] User {user_uuid} exists - RESYNC MODE (generating new API key)")
+            logger.info("[USER_CREATE] User %s exists - RESYNC MODE (generating new API key)", user_uuid)
             return await _resync_existing_user(user_uuid, user_data)
         
         # Register user in memory registry
@@ -290,27 +307,28 @@ async def create_user(request: Request, user_data: CreateUserRequest):
         logger.info("[USER_CREATE] REGISTERING USER IN MEMORY REGISTRY")
         logger.info("[USER_CREATE] ----------------------------------------")
         db_path = register_user(user_uuid)
-        logger.info(f"[USER_CREATE] User {user_uuid} registered, db_path: {db_path}")
+        logger.info("[USER_CREATE] User %s registered, db_path: %s", user_uuid, db_path)
         
         # Generate API key with embedded UUID
         logger.info("[USER_CREATE] ----------------------------------------")
         logger.info("[USER_CREATE] GENERATING API KEY")
         logger.info("[USER_CREATE] ----------------------------------------")
-        logger.info(f"[USER_CREATE] Calling generate_api_key(user_uuid={user_uuid})...")
-        plaintext_key, key_hash, key_prefix = generate_api_key(user_uuid)
-        logger.info(f"[USER_CREATE] API key generated with prefix: {key_prefix}")
+        logger.info("[USER_CREATE] Calling generate_api_key_async(user_uuid=%s)...", user_uuid)
+        plaintext_key, key_hash, key_prefix = await generate_api_key_async(user_uuid)
+        logger.info("[USER_CREATE] API key generated with prefix: %s", key_prefix)
         
-        # Initialize user's personal database (this creates the file and tables)
+        # Initialize user's personal database (this creates the file and tables and seeds
+        # it); a seeding error fails the request rather than leaving a half-created user
         logger.info("[USER_CREATE] ----------------------------------------")
         logger.info("[USER_CREATE] INITIALIZING USER DATABASE")
         logger.info("[USER_CREATE] ----------------------------------------")
-        logger.info(f"[USER_CREATE] Calling initialize_user({user_uuid})...")
+        logger.info("[USER_CREATE] Calling initialize_user(%s)...", user_uuid)
         await initialize_user(user_uuid)
         logger.info("[USER_CREATE] User database initialized and seeded")
         
-        # Save API key to user's database
+        # Save API key and user_meta to user's database in one transaction (one commit)
         logger.info("[USER_CREATE] ----------------------------------------")
-        logger.info("[USER_CREATE] SAVING API KEY TO USER DATABASE")
+        logger.info("[USER_CREATE] SAVING API KEY AND USER META TO USER DATABASE")
         logger.info("[USER_CREATE] ----------------------------------------")
         async with aiosqlite.connect(db_path) as conn:
             await conn.execute(
@@ -320,8 +338,6 @@ async def create_user(request: Request, user_data: CreateUserRequest):
                 """,
                 (key_hash, key_prefix, "WordPress API Key")
             )
-            await conn.commit()
-            logger.info("[USER_CREATE] API key saved to user's database")
             
             # Create or update user_meta with uuid, email, and ready status (NO USERNAME)
             logger.info("[USER_CREATE] Creating/updating user_meta with uuid, email, and ready status...")
@@ -342,14 +358,14 @@ async def create_user(request: Request, user_data: CreateUserRequest):
                 (meta_id, user_uuid, user_data.email, now, now, now)
             )
             await conn.commit()
-            logger.info("[USER_CREATE] user_meta created/updated with ready status")
+            logger.info("[USER_CREATE] API key saved and user_meta created/updated with ready status")
         
         logger.info("[USER_CREATE] ========================================")
         logger.info("[USER_CREATE] USER CREATION COMPLETE")
-        logger.info(f"[USER_CREATE] uuid={user_uuid}")
-        logger.info(f"[USER_CREATE] email={user_data.email}")
-        logger.info(f"[USER_CREATE] api_key_prefix={key_prefix}")
-        logger.info(f"[USER_CREATE] is_first_user={is_first_user}")
+        logger.info("[USER_CREATE] uuid=%s", user_uuid)
+        logger.info("[USER_CREATE] email=%s", user_data.email)
+        logger.info("[USER_CREATE] api_key_prefix=%s", key_prefix)
+        logger.info("[USER_CREATE] is_first_user=%s", is_first_user)
         logger.info("[USER_CREATE] ========================================")
         
         return CreateUserResponse(
@@ -361,7 +377,7 @@ async def create_user(request: Request, user_data: CreateUserRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"[USER_CREATE] FATAL ERROR: {str(e)}")
+        logger.error("[USER_CREATE] FATAL ERROR: %s", e)
         logger.exception("[USER_CREATE] Full traceback:")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -370,35 +386,35 @@ async def create_user(request: Request, user_data: CreateUserRequest):
 
 
 @router.get("/users/me")
-async def get_current_user_info(user: dict = Depends(get_current_user)):
+async def get_current_user_info(request: Request, user: dict = Depends(get_current_user)):
     """
     Get information about the current authenticated user.
     
     Requires authentication via X-ACM2-API-Key header.
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
     """
     logger.info("[USER_ME] ========================================")
     logger.info("[USER_ME] GET /api/v1/users/me - GET CURRENT USER")
     logger.info("[USER_ME] ========================================")
-    logger.info(f"[USER_ME] Authenticated user UUID: {user.get('uuid')}")
+    logger.info("[USER_ME] Authenticated user UUID: %s", user.get('uuid'))
     
     user_uuid = user["uuid"]
     
+    cached = _me_cache.get(user_uuid)
+    if cached and time.monotonic() < cached[0]:
+        logger.info("[USER_ME] Cache HIT, skipping user meta lookup")
+        return _user_info_response(request, cached[1])
+    
     logger.info("[USER_ME] Opening user session to check user meta...")
     async with get_user_session_by_uuid(user_uuid) as session:
-        result = await session.execute(
-            select(UserMeta).where(UserMeta.uuid == user_uuid)
-        )
+        result = await session.execute(_USER_META_BY_UUID, {"uuid": user_uuid})
         meta = result.scalar_one_or_none()
-        logger.info(f"[USER_ME] User meta found: {meta is not None}")
+        logger.info("[USER_ME] User meta found: %s", meta is not None)
 
         if not meta or meta.seed_status != "ready":
             logger.info("[USER_ME] User not seeded or not ready, calling initialize_user()...")
-            await initialize_user(user_uuid)
-            result = await session.execute(
-                select(UserMeta).where(UserMeta.uuid == user_uuid)
-            )
-            meta = result.scalar_one_or_none()
-            logger.info(f"[USER_ME] After initialization, meta found: {meta is not None}")
+            meta = await initialize_user(user_uuid)
+            logger.info("[USER_ME] After initialization, meta found: %s", meta is not None)
 
     if not meta or meta.seed_status != "ready":
         logger.warning("[USER_ME] User setup still in progress")
@@ -414,7 +430,20 @@ async def get_current_user_info(user: dict = Depends(get_current_user)):
         "seed_version": meta.seed_version,
         "seeded_at": meta.seeded_at.isoformat() if meta.seeded_at else None,
     }
-    logger.info(f"[USER_ME] Returning user info: {response_data}")
+    logger.info("[USER_ME] Returning user info: %s", response_data)
     logger.info("[USER_ME] ========================================")
     
-    return response_data
+    if user_uuid not in _me_cache and len(_me_cache) >= _ME_CACHE_MAX_ENTRIES:
+        del _me_cache[next(iter(_me_cache))]
+    _me_cache[user_uuid] = (time.monotonic() + _ME_CACHE_TTL_SECONDS, response_data)
+    return _user_info_response(request, response_data)
+
+
+def _user_info_response(request: Request, response_data: Dict[str, Any]) -> Response:
+    """Send /users/me data with a content ETag, or 304 if the client already has it."""
+    digest = hashlib.blake2b(json.dumps(response_data, sort_keys=True).encode(), digest_size=8)
+    etag = f'"{digest.hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(response_data, headers=headers)
@@ -4,7 +4,7 @@ API Schemas for Documents.
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentType(str, Enum):
@@ -61,8 +61,7 @@ class DocumentSummary(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DocumentDetail(BaseModel):
@@ -94,8 +93,7 @@ class DocumentDetail(BaseModel):
     # Usage stats
     run_count: int = Field(0, description="Number of runs using this document")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DocumentList(BaseModel):
@@ -4,7 +4,7 @@ Pydantic schemas for GitHub Connection API.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -46,8 +46,7 @@ class GitHubConnectionSummary(BaseModel):
     last_tested_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GitHubConnectionDetail(BaseModel):
@@ -62,8 +61,7 @@ class GitHubConnectionDetail(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GitHubConnectionList(BaseModel):
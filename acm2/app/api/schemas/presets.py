@@ -6,7 +6,7 @@ Presets are saved configurations for runs that can be reused.
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .runs import (
     GeneratorType, ModelConfig, GptrSettings, FpfSettings, 
@@ -219,8 +219,7 @@ class PresetResponse(BaseModel):
     run_count: int = 0
     last_run_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True  # Enable ORM mode
+    model_config = ConfigDict(from_attributes=True)  # Enable ORM mode
 
 
 class PresetSummary(BaseModel):
@@ -236,8 +235,7 @@ class PresetSummary(BaseModel):
     updated_at: Optional[datetime] = None
     run_count: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PresetList(BaseModel):
@@ -6,7 +6,7 @@ These Pydantic models define the request/response shapes for the runs API.
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -112,7 +112,7 @@ class FpfConfigComplete(BaseModel):
     grounding, it's mandatory and non-configurable.
     """
     enabled: bool = True
-    selected_models: list[str] = Field(default_factory=list, description="REQUIRED from preset")
+    selected_models: tuple[str, ...] = Field((), description="REQUIRED from preset")
     max_tokens: int = Field(32000, ge=1)
     temperature: float = Field(0.7, ge=0, le=2)
     top_p: float = Field(0.95, ge=0, le=1)
@@ -123,11 +123,13 @@ class FpfConfigComplete(BaseModel):
     include_metadata: bool = True
     save_prompt_history: bool = True
 
+    model_config = ConfigDict(frozen=True)
+
 
 class GptrConfigComplete(BaseModel):
     """Complete GPTR configuration for preset persistence."""
     enabled: bool = True
-    selected_models: list[str] = Field(default_factory=list, description="REQUIRED from preset")
+    selected_models: tuple[str, ...] = Field((), description="REQUIRED from preset")
     fast_llm_token_limit: int = Field(4000, ge=1000)
     smart_llm_token_limit: int = Field(8000, ge=1000)
     strategic_llm_token_limit: int = Field(16000, ge=1000)
@@ -149,11 +151,13 @@ class GptrConfigComplete(BaseModel):
     subprocess_timeout_minutes: int = Field(20, ge=10, le=45, description="Subprocess timeout in minutes (10-45)")
     subprocess_retries: int = Field(1, ge=0, le=3, description="Number of retries on timeout (0-3)")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class DrConfigComplete(BaseModel):
     """Complete Deep Research configuration for preset persistence."""
     enabled: bool = False
-    selected_models: list[str] = Field(default_factory=list, description="REQUIRED from preset if enabled")
+    selected_models: tuple[str, ...] = Field((), description="REQUIRED from preset if enabled")
     breadth: int = Field(4, ge=1, le=8)
     depth: int = Field(3, ge=1, le=8)
     max_results: int = Field(10, ge=1, le=20)
@@ -172,11 +176,13 @@ class DrConfigComplete(BaseModel):
     subprocess_timeout_minutes: int = Field(20, ge=10, le=45, description="Subprocess timeout in minutes (10-45)")
     subprocess_retries: int = Field(1, ge=0, le=3, description="Number of retries on timeout (0-3)")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MaConfigComplete(BaseModel):
     """Complete Multi-Agent configuration for preset persistence."""
     enabled: bool = False
-    selected_models: list[str] = Field(default_factory=list, description="REQUIRED from preset if enabled")
+    selected_models: tuple[str, ...] = Field((), description="REQUIRED from preset if enabled")
     max_agents: int = Field(3, ge=1, le=10)
     communication_style: str = "sequential"
     enable_consensus: bool = True
@@ -184,6 +190,8 @@ class MaConfigComplete(BaseModel):
     enable_voting: bool = False
     max_rounds: int = Field(3, ge=1, le=10)
 
+    model_config = ConfigDict(frozen=True)
+
 
 class EvalConfigComplete(BaseModel):
     """Complete Evaluation configuration for preset persistence."""
@@ -191,7 +199,7 @@ class EvalConfigComplete(BaseModel):
     auto_run: bool = True
     iterations: int = Field(3, ge=1, le=9)
     pairwise_top_n: int = Field(5, ge=1, le=10)
-    judge_models: list[str] = Field(default_factory=list, description="REQUIRED from preset")
+    judge_models: tuple[str, ...] = Field((), description="REQUIRED from preset")
     timeout_seconds: int = Field(600, ge=60, le=3600, description="Per-call timeout for judge LLM")
     retries: int = Field(3, ge=0, le=10, description="Retry count for transient failures")
     temperature: float = Field(0.3, ge=0.0, le=2.0, description="Temperature for judge LLM")
@@ -204,20 +212,26 @@ class EvalConfigComplete(BaseModel):
     enable_completeness: bool = True
     enable_citation: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PairwiseConfigComplete(BaseModel):
     """Complete Pairwise configuration for preset persistence."""
     enabled: bool = False
-    judge_models: list[str] = Field(default_factory=list, description="REQUIRED from preset if enabled")
+    judge_models: tuple[str, ...] = Field((), description="REQUIRED from preset if enabled")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class CombineConfigComplete(BaseModel):
     """Complete Combine configuration for preset persistence."""
     enabled: bool = False
-    selected_models: list[str] = Field(default_factory=list, description="REQUIRED from preset if enabled")
+    selected_models: tuple[str, ...] = Field((), description="REQUIRED from preset if enabled")
     strategy: str = Field("", description="REQUIRED from preset if enabled")
     max_tokens: Optional[int] = Field(None, description="Max output tokens for combine phase (REQUIRED if enabled)")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class GeneralConfigComplete(BaseModel):
     """Complete General configuration for preset persistence."""
@@ -243,6 +257,8 @@ class GeneralConfigComplete(BaseModel):
     enable_logging: bool = Field(True, description="Deprecated")
     save_intermediate: bool = Field(True, description="Deprecated")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ConcurrencyConfigComplete(BaseModel):
     """Complete Concurrency configuration for preset persistence."""
@@ -263,6 +279,8 @@ class ConcurrencyConfigComplete(BaseModel):
     launch_delay: Optional[float] = Field(1.0, ge=0, description="Deprecated")
     enable_rate_limiting: Optional[bool] = Field(True, description="Deprecated")
 
+    model_config = ConfigDict(frozen=True)
+
 
 # ============================================================================
 # Request Models
@@ -384,8 +402,7 @@ class RunSummary(BaseModel):
     completed_at: Optional[datetime] = None
     tags: list[str] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GeneratedDocInfo(BaseModel):
@@ -647,8 +664,7 @@ class RunDetail(BaseModel):
     # Organization
     tags: list[str] = Field(default_factory=list)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RunList(BaseModel):
@@ -13,6 +13,7 @@ UUID ONLY - No bland usernames, no integer user IDs.
 
 EXTREME LOGGING ENABLED.
 """
+import asyncio
 import secrets
 import bcrypt
 import re
@@ -91,6 +92,15 @@ def generate_api_key(user_uuid: str) -> Tuple[str, str, str]:
         raise
 
 
+async def generate_api_key_async(user_uuid: str) -> Tuple[str, str, str]:
+    """Like generate_api_key(), but runs the bcrypt hashing in a worker thread.
+
+    bcrypt releases the GIL while hashing, so this keeps the event loop free
+    for other requests during the ~100ms of key stretching.
+    """
+    return await asyncio.to_thread(generate_api_key, user_uuid)
+
+
 def parse_api_key(key: str) -> Optional[Tuple[str, str]]:
     """Parse an API key to extract UUID and random part.
     
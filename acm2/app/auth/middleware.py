@@ -9,6 +9,7 @@ No master database required - UUID is parsed from key.
 """
 from fastapi import Header, HTTPException, status
 from typing import Optional, Dict, Any
+import hashlib
 import logging
 import time
 import aiosqlite
@@ -19,31 +20,74 @@ from app.auth.user_registry import get_user_db_path, user_exists, construct_db_p
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache: api_key -> (user_dict, expiry_timestamp)
-# Keys are cached for 5 minutes after successful validation
-_auth_cache: Dict[str, tuple] = {}
+# In-memory cache: blake2b(api_key) -> (user_dict, expiry_timestamp)
+# Keys are cached for 5 minutes after successful validation; raw keys are never stored
+_auth_cache: Dict[bytes, tuple] = {}
 _CACHE_TTL_SECONDS = 300  # 5 minutes
+_CACHE_MAX_ENTRIES = 1024
+
+# Keys that just failed validation: blake2b(api_key) -> expiry_timestamp
+# A short window so retries of a bad key don't each pay for a DB read and bcrypt checks
+_failed_auth_cache: Dict[bytes, float] = {}
+_FAILED_CACHE_TTL_SECONDS = 5
+
+
+def _cache_key(api_key: str) -> bytes:
+    return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
 
 
 def _get_cached_user(api_key: str) -> Optional[Dict[str, Any]]:
     """Get user from cache if valid and not expired."""
-    if api_key in _auth_cache:
-        user, expiry = _auth_cache[api_key]
-        if time.time() < expiry:
+    key = _cache_key(api_key)
+    entry = _auth_cache.get(key)
+    if entry:
+        user, expiry = entry
+        if time.monotonic() < expiry:
             return user
         # Expired, remove from cache
-        del _auth_cache[api_key]
+        del _auth_cache[key]
     return None
 
 
 def _cache_user(api_key: str, user: Dict[str, Any]) -> None:
-    """Cache authenticated user."""
-    _auth_cache[api_key] = (user, time.time() + _CACHE_TTL_SECONDS)
+    """Cache authenticated user (evicting the oldest entry when full)."""
+    key = _cache_key(api_key)
+    if key not in _auth_cache and len(_auth_cache) >= _CACHE_MAX_ENTRIES:
+        del _auth_cache[next(iter(_auth_cache))]
+    _auth_cache[key] = (user, time.monotonic() + _CACHE_TTL_SECONDS)
+
+
+def _is_recent_failure(api_key: str) -> bool:
+    """Check whether this key failed validation within the last few seconds."""
+    key = _cache_key(api_key)
+    expiry = _failed_auth_cache.get(key)
+    if expiry is None:
+        return False
+    if time.monotonic() < expiry:
+        return True
+    del _failed_auth_cache[key]
+    return False
+
+
+def _cache_failure(api_key: str) -> None:
+    """Remember a key that failed validation (evicting the oldest entry when full)."""
+    key = _cache_key(api_key)
+    if key not in _failed_auth_cache and len(_failed_auth_cache) >= _CACHE_MAX_ENTRIES:
+        del _failed_auth_cache[next(iter(_failed_auth_cache))]
+    _failed_auth_cache[key] = time.monotonic() + _FAILED_CACHE_TTL_SECONDS
 
 
 def clear_auth_cache() -> None:
     """Clear the auth cache (call when API keys are revoked)."""
     _auth_cache.clear()
+    _failed_auth_cache.clear()
+
+
+def forget_user(user_uuid: str) -> None:
+    """Drop cached logins for one user (call when that user's API keys are replaced)."""
+    stale = [key for key, (user, _) in _auth_cache.items() if user.get('uuid') == user_uuid]
+    for key in stale:
+        del _auth_cache[key]
 
 
 class AuthenticationError(HTTPException):
@@ -101,6 +145,10 @@ async def get_current_user(
         logger.info(f"[AUTH] Cache HIT for user {cached_user.get('uuid')}")
         return cached_user
     
+    if _is_recent_failure(x_acm2_api_key):
+        logger.warning("[AUTH] Key failed validation moments ago, rejecting without lookup")
+        raise AuthenticationError("Invalid API key")
+    
     logger.info("[AUTH] Cache MISS, validating key...")
     
     # Validate format
@@ -122,6 +170,7 @@ async def get_current_user(
     
     if not db_path.exists():
         logger.warning(f"[AUTH] User database does not exist: {db_path}")
+        _cache_failure(x_acm2_api_key)
         raise AuthenticationError("Invalid API key")
     
     # Look up key hash in user's database
@@ -155,6 +204,7 @@ async def get_current_user(
             
             if not valid_key_found:
                 logger.warning(f"[AUTH] No matching key hash for user {user_uuid}")
+                _cache_failure(x_acm2_api_key)
                 raise AuthenticationError("Invalid API key")
             
             # Get user info from user_meta table (UUID and email only - NO USERNAME)
@@ -10,7 +10,7 @@ import uuid
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy import select, event
@@ -216,7 +216,7 @@ async def seed_user_data(user_uuid: str, source_session: AsyncSession, target_se
     return id_mapping
 
 
-async def initialize_user(user_uuid: str) -> Dict[str, str]:
+async def initialize_user(user_uuid: str) -> Optional[UserMeta]:
     """
     Full initialization for a new user:
     1. Create per-user SQLite database schema using SQLAlchemy
@@ -226,7 +226,8 @@ async def initialize_user(user_uuid: str) -> Dict[str, str]:
         user_uuid: The user's UUID
         
     Returns:
-        Dict mapping original IDs to new user-specific IDs
+        The user's UserMeta row as it stands afterwards (seed_status is 'ready' on
+        success), or None if seeding wrote no row; callers need not re-select it
     """
     lock = _seed_locks.setdefault(user_uuid, asyncio.Lock())
     async with lock:
@@ -246,14 +247,19 @@ async def initialize_user(user_uuid: str) -> Dict[str, str]:
                     meta = existing_meta.scalar_one_or_none()
                     if meta and meta.seed_status == "ready":
                         logger.info(f"User {user_uuid} already seeded (version={meta.seed_version})")
-                        return {}
-                    id_mapping = await seed_user_data(user_uuid, source_session, target_session)
-                    # Commit is handled in seed_user_data
+                        return meta
+                    await seed_user_data(user_uuid, source_session, target_session)
+                    # Commit is handled in seed_user_data; the row it wrote is in this
+                    # session's identity map, so this returns that object as updated
+                    existing_meta = await target_session.execute(
+                        select(UserMeta).where(UserMeta.uuid == user_uuid)
+                    )
+                    meta = existing_meta.scalar_one_or_none()
                 except Exception:
                     await target_session.rollback()
                     raise
 
-        return id_mapping
+        return meta
 
 
 async def main():
@@ -272,11 +278,9 @@ async def main():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    id_mapping = await initialize_user(user_uuid)
+    meta = await initialize_user(user_uuid)
 
-    print(f"\nSeeded data for user {user_uuid}:")
-    for original_id, new_id in id_mapping.items():
-        print(f"  {original_id} -> {new_id}")
+    print(f"\nSeed status for user {user_uuid}: {meta.seed_status if meta else 'not seeded'}")
 
 
 def _deep_replace_ids(value: object, id_map: Dict[str, str]) -> object:
@@ -1,7 +1,8 @@
 """
 Content repository for CRUD operations on content.
 """
-from typing import Optional, Sequence
+import time
+from typing import NamedTuple, Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +11,25 @@ from app.infra.db.models.content import Content, ContentType
 from app.infra.db.repositories.base import BaseRepository
 
 
+class ContentSnapshot(NamedTuple):
+    """Detached, read-only copy of the content fields a run needs."""
+    id: str
+    name: str
+    body: str
+    content_type: str
+
+
+# Short-lived cache of content snapshots keyed by (user_uuid, content_id). Entries are
+# dropped on every write made through ContentRepository; the TTL bounds staleness for
+# writes made any other way.
+_SNAPSHOT_TTL_SECONDS = 60.0
+_SNAPSHOT_CACHE_MAX = 1024
+_snapshots: dict[tuple[Optional[str], str], tuple[float, ContentSnapshot]] = {}
+# Bumped by every eviction. A reader that sees it change while its SELECT was in flight
+# may hold rows from before a write, so it returns them without caching them.
+_snapshot_generation = 0
+
+
 class ContentRepository(BaseRepository[Content]):
     """Repository for Content CRUD operations."""
     
@@ -97,12 +117,29 @@ class ContentRepository(BaseRepository[Content]):
         all_results = result.scalars().all()
         return [c for c in all_results if tag in (c.tags or [])]
     
+    def _forget_snapshot(self, id: str) -> None:
+        # Writers call this before the write and again once it has committed; the
+        # generation bump stops a get_snapshots already in flight from caching old rows
+        global _snapshot_generation
+        _snapshot_generation += 1
+        _snapshots.pop((self.user_uuid, id), None)
+
+    async def update(self, id: str, **kwargs) -> Optional[Content]:
+        """Update a content by ID (scoped to user if user_uuid is set)."""
+        self._forget_snapshot(id)
+        try:
+            return await super().update(id, **kwargs)
+        finally:
+            self._forget_snapshot(id)
+
     async def delete(self, id: str) -> bool:
         """Permanently delete a content from the database."""
+        self._forget_snapshot(id)
         content = await self.get_by_id(id)
         if content:
             await self.session.delete(content)
             await self.session.commit()
+            self._forget_snapshot(id)
             return True
         return False
     
@@ -117,7 +154,34 @@ class ContentRepository(BaseRepository[Content]):
         stmt = self._apply_user_filter(stmt)
         result = await self.session.execute(stmt)
         return result.scalars().all()
-    
+
+    async def get_snapshots(self, ids: list[str]) -> dict[str, ContentSnapshot]:
+        """Get read-only snapshots of multiple contents, keyed by ID (missing IDs are omitted).
+
+        Served from a short-lived in-process cache; only uncached IDs hit the database,
+        in one query.
+        """
+        now = time.monotonic()
+        found: dict[str, ContentSnapshot] = {}
+        missing: list[str] = []
+        for id in dict.fromkeys(i for i in ids if i):
+            entry = _snapshots.get((self.user_uuid, id))
+            if entry and entry[0] > now:
+                found[id] = entry[1]
+            else:
+                missing.append(id)
+        if missing:
+            generation = _snapshot_generation
+            for c in await self.get_by_ids(missing):
+                snapshot = ContentSnapshot(c.id, c.name, c.body, c.content_type)
+                found[c.id] = snapshot
+                if generation != _snapshot_generation:
+                    continue
+                if len(_snapshots) >= _SNAPSHOT_CACHE_MAX:
+                    del _snapshots[next(iter(_snapshots))]
+                _snapshots[(self.user_uuid, c.id)] = (now + _SNAPSHOT_TTL_SECONDS, snapshot)
+        return found
+
     async def update_body(
         self, 
         id: str, 
@@ -125,12 +189,14 @@ class ContentRepository(BaseRepository[Content]):
         variables: Optional[dict] = None
     ) -> Optional[Content]:
         """Update content body and optionally variables."""
+        self._forget_snapshot(id)
         content = await self.get_by_id(id)
         if content:
             content.body = body
             if variables is not None:
                 content.variables = variables
             await self.session.commit()
+            self._forget_snapshot(id)
             await self.session.refresh(content)
             return content
         return None
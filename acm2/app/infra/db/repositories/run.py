@@ -2,11 +2,11 @@
 Run repository for CRUD operations on runs.
 """
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.infra.db.models.run import Run, RunStatus
 from app.infra.db.repositories.base import BaseRepository
@@ -31,24 +31,48 @@ class RunRepository(BaseRepository[Run]):
         return result.scalars().all()
     
     async def get_with_tasks(self, id: str) -> Optional[Run]:
-        """Get a run with its tasks eagerly loaded (scoped to user if user_uuid is set)."""
+        """Get a run with its tasks eagerly loaded (scoped to user if user_uuid is set).
+
+        Any other relationship raises on access instead of lazy-loading one query per run.
+        """
+        stmt = (
+            select(Run)
+            .options(selectinload(Run.tasks), raiseload("*"))
+            .where(Run.id == id)
+        )
+        stmt = self._apply_user_filter(stmt)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    async def get_with_preset(self, id: str) -> Optional[Run]:
+        """Get a run with its preset joined in the same query (scoped to user if user_uuid is set)."""
         stmt = (
             select(Run)
-            .options(selectinload(Run.tasks))
+            .options(joinedload(Run.preset))
             .where(Run.id == id)
         )
         stmt = self._apply_user_filter(stmt)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_status(self, id: str) -> Optional[str]:
+        """Get only a run's status, or None if it does not exist (scoped to user if user_uuid is set)."""
+        stmt = select(Run.status).where(Run.id == id)
+        stmt = self._apply_user_filter(stmt)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+    
     async def get_all_with_tasks(
         self, 
         limit: int = 100, 
         offset: int = 0,
         status: Optional[str] = None
     ) -> Sequence[Run]:
-        """Get all runs with tasks eagerly loaded (scoped to user if user_uuid is set)."""
-        stmt = select(Run).options(selectinload(Run.tasks))
+        """Get all runs with tasks eagerly loaded (scoped to user if user_uuid is set).
+
+        Any other relationship raises on access instead of lazy-loading one query per run.
+        """
+        stmt = select(Run).options(selectinload(Run.tasks), raiseload("*"))
         
         # Apply user filter
         stmt = self._apply_user_filter(stmt)
@@ -407,3 +431,28 @@ class RunRepository(BaseRepository[Run]):
             await self.session.refresh(run)
             return run
         return None
+
+    async def transition(
+        self,
+        id: str,
+        from_states: Iterable[RunStatus],
+        to_state: RunStatus,
+        **values
+    ) -> Optional[Run]:
+        """Move a run to to_state only if it is currently in one of from_states.
+
+        Check and write happen in a single UPDATE ... RETURNING. Returns the updated
+        run, or None if the run does not exist (for this user) or is in another state.
+        """
+        stmt = (
+            update(Run)
+            .where(Run.id == id, Run.status.in_([s.value for s in from_states]))
+            .values(status=to_state.value, **values)
+            .returning(Run)
+        )
+        if self.user_uuid is not None:
+            stmt = stmt.where(Run.user_uuid == self.user_uuid)
+        result = await self.session.execute(stmt)
+        run = result.scalar_one_or_none()
+        await self.session.commit()
+        return run
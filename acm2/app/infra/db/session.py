@@ -29,6 +29,8 @@ def _set_sqlite_pragma(dbapi_conn, connection_record):
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB; bounded by the file size
     cursor.close()
 
 
@@ -298,7 +300,15 @@ async def get_user_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+# Users whose seed status has been seen as 'ready' in this process. Seeding never
+# reverts, so their per-request user_meta check can be skipped.
+_seed_ready_users: set[str] = set()
+
+
 async def _ensure_seed_ready(session: AsyncSession, user_uuid: str) -> None:
+    if user_uuid in _seed_ready_users:
+        return
+
     from app.infra.db.models.user_meta import UserMeta
     from app.db.seed_user import initialize_user
 
@@ -307,17 +317,13 @@ async def _ensure_seed_ready(session: AsyncSession, user_uuid: str) -> None:
     )
     meta = result.scalar_one_or_none()
     if not meta or meta.seed_status != "ready":
-        await initialize_user(user_uuid)
-
-        result = await session.execute(
-            select(UserMeta).where(UserMeta.uuid == user_uuid)
-        )
-        meta = result.scalar_one_or_none()
+        meta = await initialize_user(user_uuid)
         if not meta or meta.seed_status != "ready":
             raise HTTPException(
                 status_code=status.HTTP_425_TOO_EARLY,
                 detail="User setup in progress"
             )
+    _seed_ready_users.add(user_uuid)
 
 
 async def init_db() -> None:
@@ -81,9 +81,12 @@ class GeneratedDocument:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunConfig:
-    """Configuration for a run. All fields are REQUIRED unless explicitly Optional."""
+    """Configuration for a run. All fields are REQUIRED unless explicitly Optional.
+
+    Slotted: one is built per started run, and only declared fields are ever assigned.
+    """
     
     # User Context - REQUIRED for multi-user system
     user_uuid: str  # User UUID for fetching encrypted provider API keys